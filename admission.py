@@ -0,0 +1,240 @@
+"""
+Incremental admission control.
+
+AdmissionController keeps the analysis results of a task set that changes
+over time, so that adding, removing or modifying one task only re-analyses
+the tasks it can affect instead of the whole set.
+"""
+
+import bisect
+from fractions import Fraction
+
+from analysis import processor_demand_test, response_time
+
+
+class AdmissionController:
+    """
+    Admission control for RMS, DM or EDF on a single CPU.
+
+    The total utilization is kept as an exact fraction. For the fixed-priority
+    policies (RMS, DM) the worst-case response time of every task is cached:
+    a change to one task only affects tasks of lower priority, and when a task
+    is added their new response times are solved starting from the cached ones.
+    For EDF, implicit-deadline sets are decided by U <= 1 in O(1); sets with
+    constrained deadlines fall back to a full QPA run.
+
+    As in analysis.py, deadlines longer than the period are capped at the period.
+    """
+
+    def __init__(self, policy="RMS", tasks=()):
+        if policy not in ("RMS", "DM", "EDF"):
+            raise ValueError(f"Unknown scheduling policy: {policy}")
+        self.policy = policy
+        self._tasks = {}  # name -> (C, T, D)
+        self._order = []  # (priority key, seq, name), highest priority first
+        self._seq = {}  # name -> insertion number, breaks priority ties
+        self._next_seq = 0
+        self._response = {}  # name -> response time, or None if it can miss
+        self._failed = set()  # names whose response time is None
+        self._U = Fraction(0)
+        self._constrained = 0  # number of tasks with D < T
+        self._edf_ok = True
+        for t in tasks:
+            self.add(t)
+
+    # -------------------- Queries --------------------
+
+    def __len__(self):
+        return len(self._tasks)
+
+    def __contains__(self, name):
+        return name in self._tasks
+
+    @property
+    def utilization(self):
+        return float(self._U)
+
+    def response_times(self):
+        """
+        Cached worst-case response times (RMS and DM only).
+        """
+        if self.policy == "EDF":
+            raise ValueError("Response times are only kept for RMS and DM.")
+        return {name: self._response[name] for _, _, name in self._order}
+
+    def is_schedulable(self):
+        if self.policy == "EDF":
+            return self._edf_ok
+        return not self._failed
+
+    def can_admit(self, task):
+        """
+        Check whether the set stays schedulable with the task added, without
+        changing the admitted set. A task with an existing name is treated
+        as a modification of that task.
+        """
+        name, C, T, D = self._normalize(task)
+        if name in self._tasks:
+            return self._check_with(name, (C, T, D))
+        if self._U + Fraction(C, T) > 1:
+            return False
+        if self.policy == "EDF":
+            return self._edf_check(extra=(C, T, D))
+        if self._failed:
+            return False
+
+        entry = (self._key(C, T, D), self._next_seq, name)
+        pos = bisect.bisect(self._order, entry)
+        hp = [self._tasks[n][:2] for _, _, n in self._order[:pos]]
+        if response_time(C, hp, D) is None:
+            return False
+        hp.append((C, T))
+        for _, _, n in self._order[pos:]:
+            Cn, Tn, Dn = self._tasks[n]
+            R = response_time(Cn, hp, Dn, start=self._response[n])
+            if R is None:
+                return False
+            hp.append((Cn, Tn))
+        return True
+
+    # -------------------- Updates --------------------
+
+    def admit(self, task):
+        """
+        Add the task only if the set stays schedulable. Returns True if it
+        was admitted.
+        """
+        if not self.can_admit(task):
+            return False
+        self.add(task)
+        return True
+
+    def add(self, task):
+        """
+        Add a task unconditionally (or modify it, if the name already exists).
+        """
+        name, C, T, D = self._normalize(task)
+        if name in self._tasks:
+            self.modify(task)
+            return
+        self._seq[name] = self._next_seq
+        self._next_seq += 1
+        self._insert(name, C, T, D)
+
+    def remove(self, name):
+        """
+        Remove a task by name.
+        """
+        C, T, D = self._tasks.pop(name)
+        self._U -= Fraction(C, T)
+        if D < T:
+            self._constrained -= 1
+        seq = self._seq.pop(name)
+        if self.policy == "EDF":
+            self._edf_ok = self._edf_check()
+            return
+
+        pos = bisect.bisect_left(self._order, (self._key(C, T, D), seq, name))
+        del self._order[pos]
+        del self._response[name]
+        self._failed.discard(name)
+        # Lower-priority tasks see less interference; solve them again
+        self._update_from(pos)
+
+    def modify(self, task):
+        """
+        Change the parameters of an admitted task, keeping its tie-break order.
+        """
+        name, C, T, D = self._normalize(task)
+        seq = self._seq[name]
+        self.remove(name)
+        self._seq[name] = seq
+        self._insert(name, C, T, D)
+
+    # -------------------- Internals --------------------
+
+    def _normalize(self, task):
+        name = task["Name"]
+        C = int(task["Execution Time"])
+        T = int(task["Period"])
+        D = int(task["Deadline"])
+        if C <= 0 or T <= 0 or D <= 0:
+            raise ValueError("All task parameters must be positive.")
+        return name, C, T, min(D, T)
+
+    def _key(self, C, T, D):
+        if self.policy == "DM":
+            return D
+        return T
+
+    def _insert(self, name, C, T, D):
+        self._tasks[name] = (C, T, D)
+        self._U += Fraction(C, T)
+        if D < T:
+            self._constrained += 1
+        if self.policy == "EDF":
+            self._edf_ok = self._edf_check()
+            return
+
+        entry = (self._key(C, T, D), self._seq[name], name)
+        pos = bisect.bisect(self._order, entry)
+        self._order.insert(pos, entry)
+        hp = [self._tasks[n][:2] for _, _, n in self._order[:pos]]
+        self._set_response(name, response_time(C, hp, D))
+        hp.append((C, T))
+        # Lower-priority tasks only see more interference, so their cached
+        # response times are valid starting points
+        for _, _, n in self._order[pos + 1:]:
+            Cn, Tn, Dn = self._tasks[n]
+            if self._response[n] is not None:
+                self._set_response(n, response_time(Cn, hp, Dn, start=self._response[n]))
+            hp.append((Cn, Tn))
+
+    def _update_from(self, pos):
+        hp = [self._tasks[n][:2] for _, _, n in self._order[:pos]]
+        for _, _, n in self._order[pos:]:
+            Cn, Tn, Dn = self._tasks[n]
+            self._set_response(n, response_time(Cn, hp, Dn))
+            hp.append((Cn, Tn))
+
+    def _set_response(self, name, R):
+        self._response[name] = R
+        if R is None:
+            self._failed.add(name)
+        else:
+            self._failed.discard(name)
+
+    def _edf_check(self, extra=None):
+        U = self._U
+        constrained = self._constrained
+        if extra is not None:
+            C, T, D = extra
+            U += Fraction(C, T)
+            constrained += D < T
+        if U > 1:
+            return False
+        if constrained == 0:
+            return True
+        params = list(self._tasks.values())
+        if extra is not None:
+            params.append(extra)
+        C, T, D = (list(col) for col in zip(*params))
+        return processor_demand_test(C, T, D)
+
+    def _check_with(self, name, params):
+        """
+        Evaluate a modification on a copy of the controller.
+        """
+        trial = AdmissionController(self.policy)
+        trial._tasks = dict(self._tasks)
+        trial._order = list(self._order)
+        trial._seq = dict(self._seq)
+        trial._next_seq = self._next_seq
+        trial._response = dict(self._response)
+        trial._failed = set(self._failed)
+        trial._U = self._U
+        trial._constrained = self._constrained
+        trial._edf_ok = self._edf_ok
+        C, T, D = params
+        trial.modify({"Name": name, "Execution Time": C, "Period": T, "Deadline": D})
+        return trial.is_schedulable()
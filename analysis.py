@@ -0,0 +1,260 @@
+"""
+Analytical schedulability tests.
+
+These tests decide schedulability from the task parameters alone, without
+running a simulation:
+
+    - Liu & Layland utilization bound (RMS, sufficient)
+    - hyperbolic bound (RMS, sufficient)
+    - response-time analysis (RMS / DM, exact)
+    - processor-demand analysis with QPA (EDF, exact)
+
+Deadlines longer than the period are treated as equal to the period. This
+keeps every test sufficient for the simulator, where a job that is still
+running at its next release is replaced by the new job.
+"""
+
+import math
+
+from scheduler import compute_utilization
+from taskset import as_task_set
+
+
+def _params(tasks):
+    """
+    Return (names, C, T, D) lists for the tasks that need CPU time, with
+    D capped at T.
+    """
+    ts = as_task_set(tasks)
+    if (ts.T <= 0).any():
+        raise ValueError("Task periods must be positive.")
+    names, C, T, D = [], [], [], []
+    for name, c, t, d in zip(ts.names, ts.C.tolist(), ts.T.tolist(), ts.D.tolist()):
+        if c <= 0:
+            continue
+        names.append(name)
+        C.append(c)
+        T.append(t)
+        D.append(min(d, t))
+    return names, C, T, D
+
+
+# -------------------- Utilization Bounds --------------------
+
+
+def liu_layland_bound(n):
+    """
+    Liu & Layland utilization bound n(2^(1/n) - 1) for n tasks.
+    """
+    if n <= 0:
+        return 1.0
+    return n * (2 ** (1.0 / n) - 1)
+
+
+def liu_layland_test(tasks):
+    """
+    Sufficient RMS test: U <= n(2^(1/n) - 1).
+
+    Only conclusive for implicit deadlines (D >= T); returns False otherwise.
+    """
+    names, C, T, D = _params(tasks)
+    if any(d < t for t, d in zip(T, D)):
+        return False
+    U = sum(c / t for c, t in zip(C, T))
+    return U <= liu_layland_bound(len(names))
+
+
+def hyperbolic_test(tasks):
+    """
+    Sufficient RMS test (Bini et al.): prod(U_i + 1) <= 2.
+
+    Only conclusive for implicit deadlines (D >= T); returns False otherwise.
+    """
+    names, C, T, D = _params(tasks)
+    if any(d < t for t, d in zip(T, D)):
+        return False
+    product = 1.0
+    for c, t in zip(C, T):
+        product *= c / t + 1
+    return product <= 2.0
+
+
+# -------------------- Response-Time Analysis --------------------
+
+
+def priority_order(tasks, policy="RMS"):
+    """
+    Task indices from highest to lowest fixed priority.
+
+    RMS orders by period and DM by deadline. Ties keep the task order, as in
+    the simulator.
+    """
+    names, C, T, D = _params(tasks)
+    if policy == "RMS":
+        key = T
+    elif policy == "DM":
+        key = D
+    else:
+        raise ValueError(f"Unknown fixed-priority policy: {policy}")
+    return sorted(range(len(names)), key=lambda i: (key[i], i))
+
+
+def response_time(c, hp, limit, start=None):
+    """
+    Solve R = c + sum(ceil(R / T_j) * C_j) over the higher-priority tasks hp,
+    given as (C_j, T_j) pairs. Returns None once R exceeds limit.
+
+    start can be any value known not to exceed the solution (for example a
+    response time computed before a task was added); it only saves iterations.
+    """
+    R = c + sum(cj for cj, _ in hp)
+    if start is not None:
+        R = max(R, start)
+    while R <= limit:
+        R_next = c + sum(-(-R // tj) * cj for cj, tj in hp)
+        if R_next == R:
+            return R
+        R = R_next
+    return None
+
+
+def response_times(tasks, policy="RMS"):
+    """
+    Exact worst-case response times under fixed priorities.
+
+    Parameters:
+        tasks: TaskSet or list of task dicts
+        policy: "RMS" (priority by period) or "DM" (priority by deadline)
+
+    Returns:
+        dict of task_name -> worst-case response time, or None if the task
+        can miss its deadline
+    """
+    names, C, T, D = _params(tasks)
+    result = {}
+    hp = []
+    for i in priority_order(tasks, policy):
+        result[names[i]] = response_time(C[i], hp, D[i])
+        hp.append((C[i], T[i]))
+    return result
+
+
+def rta_test(tasks, policy="RMS"):
+    """
+    Exact fixed-priority test: every response time is within its deadline.
+    """
+    return all(R is not None for R in response_times(tasks, policy).values())
+
+
+# -------------------- Processor-Demand Analysis --------------------
+
+
+def demand_bound(C, T, D, t):
+    """
+    Processor demand h(t) of all jobs with release and deadline in [0, t].
+    """
+    total = 0
+    for c, p, d in zip(C, T, D):
+        if t >= d:
+            total += ((t - d) // p + 1) * c
+    return total
+
+
+def _last_deadline_before(T, D, t):
+    """
+    Largest absolute deadline k*T_i + D_i that is strictly smaller than t.
+    """
+    last = 0
+    for p, d in zip(T, D):
+        if d < t:
+            last = max(last, d + (t - 1 - d) // p * p)
+    return last
+
+
+def _busy_period(C, T):
+    """
+    Length of the synchronous busy period.
+    """
+    w = sum(C)
+    while True:
+        w_next = sum(-(-w // p) * c for c, p in zip(C, T))
+        if w_next == w:
+            return w
+        w = w_next
+
+
+def qpa_test(tasks):
+    """
+    Exact EDF test for constrained deadlines using Quick Processor-demand
+    Analysis (Zhang & Burns).
+    """
+    names, C, T, D = _params(tasks)
+    return processor_demand_test(C, T, D)
+
+
+def processor_demand_test(C, T, D):
+    """
+    QPA on parameter lists of tasks with positive C and T and D <= T.
+    """
+    if not C:
+        return True
+    U = sum(c / p for c, p in zip(C, T))
+    if U > 1:
+        return False
+
+    # Only deadlines up to L need to be checked
+    L = _busy_period(C, T)
+    if U < 1:
+        L_a = max(max(D), sum((p - d) * c / p for c, p, d in zip(C, T, D)) / (1 - U))
+        L = min(L, math.ceil(L_a))
+
+    d_min = min(D)
+    t = _last_deadline_before(T, D, L + 1)
+    h = demand_bound(C, T, D, t)
+    while h <= t and h > d_min:
+        if h < t:
+            t = h
+        else:
+            t = _last_deadline_before(T, D, t)
+        h = demand_bound(C, T, D, t)
+    return h <= d_min
+
+
+# -------------------- Combined Verdict --------------------
+
+
+def is_schedulable(tasks, algo="RMS", util_threshold=0.7):
+    """
+    Decide whether the task set never misses a deadline under the given
+    algorithm, using the cheapest test that can prove it.
+
+    For "Adaptive" the algorithm chosen at start is checked: if it misses
+    no deadlines the adaptive scheduler never switches.
+    """
+    if algo == "Adaptive":
+        algo = "RMS" if compute_utilization(tasks) <= util_threshold else "EDF"
+    if algo == "RMS":
+        return liu_layland_test(tasks) or hyperbolic_test(tasks) or rta_test(tasks, "RMS")
+    if algo == "DM":
+        return rta_test(tasks, "DM")
+    if algo == "EDF":
+        return qpa_test(tasks)
+    raise ValueError(f"Unknown scheduling algorithm: {algo}")
+
+
+def schedulability_report(tasks):
+    """
+    Run every test and return a list of dicts with keys Test, Policy, Result.
+    """
+    return [
+        {"Test": "Liu & Layland bound", "Policy": "RMS",
+         "Result": liu_layland_test(tasks)},
+        {"Test": "Hyperbolic bound", "Policy": "RMS",
+         "Result": hyperbolic_test(tasks)},
+        {"Test": "Response-time analysis", "Policy": "RMS",
+         "Result": rta_test(tasks, "RMS")},
+        {"Test": "Response-time analysis", "Policy": "DM",
+         "Result": rta_test(tasks, "DM")},
+        {"Test": "Processor demand (QPA)", "Policy": "EDF",
+         "Result": qpa_test(tasks)},
+    ]
@@ -0,0 +1,288 @@
+"""
+Sporadic tasks and aperiodic jobs served by a server.
+
+Periodic tasks can be made sporadic: their period becomes the minimum
+inter-arrival time, and every release is delayed by a random amount of up to
+the task's jitter. Aperiodic jobs (event-driven work with an arrival time and
+an execution time but no deadline) are queued in arrival order and run
+through one of four servers:
+
+    - "polling": budget Q every period T_s; the budget is dropped as soon
+      as the queue is empty, so jobs arriving later wait for the next period
+    - "deferrable": budget Q every period T_s, kept while the queue is empty
+    - "sporadic": budget Q; what the server consumes is given back T_s after
+      it became active
+    - "tbs": Total Bandwidth Server (EDF only); every job gets the deadline
+      max(arrival, previous deadline) + C / U_s and runs as an EDF job
+
+Under RMS the polling, deferrable and sporadic servers run at the priority
+of their period; under EDF they run with the deadline of their current
+period (the activation time plus T_s for the sporadic server).
+
+The simulation is event-driven like the scheduler's event engine and
+reports the response time of every aperiodic job, so servers can be
+compared on the same load.
+"""
+
+import heapq
+from collections import deque
+
+import numpy as np
+
+from scheduler import (JobReleases, ReadyQueue, Schedule, _check_builtin_mode, _initial_algo,
+                       compute_utilization)
+from taskset import as_task_set
+
+SERVERS = ["polling", "deferrable", "sporadic", "tbs"]
+SERVER = "SERVER"  # task name of the server in the schedule
+
+
+def _read_jobs(jobs):
+    """
+    Sort aperiodic jobs by arrival. Jobs are dicts with keys Arrival and
+    Execution Time, and optionally Name.
+    """
+    parsed = []
+    for k, job in enumerate(jobs):
+        arrival = int(job["Arrival"])
+        C = int(job["Execution Time"])
+        if arrival < 0 or C <= 0:
+            raise ValueError("Aperiodic jobs need a non-negative arrival and a "
+                             "positive execution time.")
+        parsed.append((arrival, k, str(job.get("Name", f"J{k + 1}")), C))
+    parsed.sort()
+    return parsed
+
+
+def simulate_aperiodic(tasks, jobs, server="polling", server_budget=1, server_period=10,
+                       server_utilization=None, mode="RMS", sim_time=100,
+                       util_threshold=0.7, jitter=None, seed=None):
+    """
+    Simulate periodic or sporadic tasks together with aperiodic jobs.
+
+    Parameters:
+        tasks: TaskSet, or list of dicts with keys:
+            Name, Execution Time, Period, Deadline
+        jobs: list of aperiodic job dicts with keys Arrival and
+            Execution Time, and optionally Name
+        server: "polling", "deferrable", "sporadic" or "tbs"
+        server_budget, server_period: budget Q and period T_s of the
+            polling, deferrable and sporadic servers
+        server_utilization: bandwidth U_s of the TBS (default Q / T_s)
+        mode: "RMS", "EDF", or "Adaptive"
+        sim_time: total time units to simulate
+        util_threshold: threshold for adaptive switching
+        jitter: optional dict of task_name -> maximum extra delay. These
+            tasks are sporadic: each release comes Period plus a random
+            0..jitter time units after the previous one
+        seed: seed for the release delays, for reproducible runs
+
+    Returns:
+        schedule: Schedule; time used by the server is labelled "SERVER"
+        total_misses: dict of task_name -> missed deadlines count
+        responses: list of dicts, one per aperiodic job, with keys Job,
+            Arrival, Execution Time, Finish and Response Time (None for
+            jobs still unfinished at sim_time)
+        util_percent: simulated CPU utilization in %
+        U: utilization of the tasks plus the server bandwidth
+        used_algo: final algorithm used at the end of simulation
+    """
+    _check_builtin_mode(mode)
+    if server not in SERVERS:
+        raise ValueError(f"Unknown aperiodic server: {server}")
+    ts = as_task_set(tasks)
+    if (ts.T <= 0).any():
+        raise ValueError("Task periods must be positive.")
+    if server == "tbs":
+        Us = server_utilization
+        if Us is None:
+            Us = server_budget / server_period
+        if not 0 < Us <= 1:
+            raise ValueError("The TBS bandwidth must be in (0, 1].")
+        if mode != "EDF":
+            raise ValueError("The Total Bandwidth Server requires EDF.")
+    else:
+        Qs, Ts = int(server_budget), int(server_period)
+        if not 0 < Qs <= Ts:
+            raise ValueError("The server budget must be positive and at most its period.")
+        Us = Qs / Ts
+
+    U = compute_utilization(tasks) + Us
+    current_algo = _initial_algo(mode, U, util_threshold)
+
+    # Periodic / sporadic tasks, as in the event engine
+    n = len(ts)
+    names = ts.names
+    J = [int((jitter or {}).get(name, 0)) for name in names]
+    releases = JobReleases(ts, J, np.random.default_rng(seed))
+    T = releases.T
+    remaining = releases.remaining
+    abs_deadline = releases.abs_deadline
+
+    # Aperiodic jobs and the server, which is entity n in the ready queue
+    arrivals = _read_jobs(jobs)
+    next_job = 0
+    pending = deque()  # [arrival index, remaining work] in arrival order
+    finish = [None] * len(arrivals)
+    job_deadline = [0.0] * len(arrivals)  # TBS deadlines
+    last_deadline = 0.0
+    budget = 0 if server != "sporadic" else Qs
+    server_deadline = 0  # EDF key of the polling, deferrable and sporadic server
+    next_period = 0  # next polling / deferrable replenishment
+    refills = []  # sporadic server replenishments as (time, amount)
+    active_since = None  # when the sporadic server became active
+    consumed = 0  # budget used by the sporadic server since active_since
+
+    def key(i):
+        if i == n:
+            if server == "tbs":
+                return (job_deadline[pending[0][0]], i)
+            return (Ts if current_algo == "RMS" else server_deadline, i)
+        return (T[i] if current_algo == "RMS" else abs_deadline[i], i)
+
+    def server_ready():
+        return bool(pending) and (server == "tbs" or budget > 0)
+
+    ready = ReadyQueue()
+    schedule = Schedule()
+    recent_misses = 0
+    total_idle = 0
+    now = 0
+
+    while now < sim_time:
+        # Release every periodic or sporadic job that is due
+        for i, missed in releases.due(now):
+            if missed:
+                recent_misses += 1
+            if remaining[i] > 0:
+                ready.push(i, key(i))
+            elif i in ready:
+                ready.remove(i)
+
+        # Queue the aperiodic jobs that have arrived
+        while next_job < len(arrivals) and arrivals[next_job][0] <= now:
+            arrival, _, _, job_C = arrivals[next_job]
+            if server == "tbs":
+                last_deadline = max(arrival, last_deadline) + job_C / Us
+                job_deadline[next_job] = last_deadline
+            pending.append([next_job, job_C])
+            next_job += 1
+
+        # Replenish the server budget
+        if server in ("polling", "deferrable"):
+            while next_period <= now:
+                budget = Qs
+                server_deadline = next_period + Ts
+                next_period += Ts
+            if server == "polling" and not pending:
+                budget = 0
+        elif server == "sporadic":
+            while refills and refills[0][0] <= now:
+                budget += heapq.heappop(refills)[1]
+            if active_since is None and server_ready():
+                active_since = now
+                server_deadline = now + Ts
+
+        if server_ready():
+            ready.push(n, key(n))
+        elif n in ready:
+            ready.remove(n)
+
+        # Adaptive switching based on recent misses
+        if mode == "Adaptive" and recent_misses >= 3 and current_algo != "EDF":
+            current_algo = "EDF"
+            for i in ready.tasks():
+                ready.update(i, key(i))
+
+        next_event = min(releases.next_time(sim_time), sim_time)
+        if next_job < len(arrivals):
+            next_event = min(next_event, arrivals[next_job][0])
+        if server in ("polling", "deferrable"):
+            next_event = min(next_event, next_period)
+        elif server == "sporadic" and refills:
+            next_event = min(next_event, refills[0][0])
+
+        if not ready:
+            schedule.append("IDLE", now, next_event)
+            total_idle += next_event - now
+            now = next_event
+            continue
+
+        chosen = ready.peek()
+        if chosen != n:
+            run = min(remaining[chosen], next_event - now)
+            schedule.append(names[chosen], now, now + run)
+            remaining[chosen] -= run
+            if remaining[chosen] == 0:
+                ready.pop()
+            now += run
+            continue
+
+        # Serve the oldest pending aperiodic job
+        job = pending[0]
+        run = min(job[1], next_event - now)
+        if server != "tbs":
+            run = min(run, budget)
+        schedule.append(SERVER, now, now + run)
+        job[1] -= run
+        now += run
+        if server != "tbs":
+            budget -= run
+            consumed += run
+        if job[1] == 0:
+            pending.popleft()
+            finish[job[0]] = now
+        if server == "polling" and not pending:
+            budget = 0
+        if server == "sporadic" and (budget == 0 or not pending):
+            heapq.heappush(refills, (active_since + Ts, consumed))
+            active_since = None
+            consumed = 0
+        if server_ready():
+            ready.update(n, key(n))
+        else:
+            ready.remove(n)
+
+    responses = [
+        {
+            "Job": name,
+            "Arrival": arrival,
+            "Execution Time": job_C,
+            "Finish": finish[j],
+            "Response Time": None if finish[j] is None else finish[j] - arrival,
+        }
+        for j, (arrival, _, name, job_C) in enumerate(arrivals)
+    ]
+    total_misses = dict(zip(names, releases.misses))
+    util_percent = 100.0 * (1 - total_idle / sim_time)
+
+    return schedule, total_misses, responses, util_percent, U, current_algo
+
+
+def server_report(tasks, jobs, servers=SERVERS, mode="EDF", **kwargs):
+    """
+    Run the same load through several servers and summarize the aperiodic
+    response times of each.
+
+    Extra keyword arguments are passed to simulate_aperiodic. The TBS is
+    skipped unless mode is "EDF".
+
+    Returns a list of dicts with keys Server, Mean Response, Max Response,
+    Unfinished and Deadline Misses (of the periodic tasks).
+    """
+    report = []
+    for server in servers:
+        if server == "tbs" and mode != "EDF":
+            continue
+        _, misses, responses, _, _, _ = simulate_aperiodic(
+            tasks, jobs, server=server, mode=mode, **kwargs
+        )
+        done = [r["Response Time"] for r in responses if r["Response Time"] is not None]
+        report.append({
+            "Server": server,
+            "Mean Response": sum(done) / len(done) if done else None,
+            "Max Response": max(done) if done else None,
+            "Unfinished": len(responses) - len(done),
+            "Deadline Misses": sum(misses.values()),
+        })
+    return report
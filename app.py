@@ -1,6 +1,15 @@
+import os
+
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
+
+from analysis import schedulability_report
+from gantt import gantt_altair, gantt_data, gantt_png
+from multiprocessor import HEURISTICS, simulate_multiprocessor
+from policies import POLICIES
+from scheduler import BUILTIN_MODES, hyperperiod
+from store import ResultStore, cached_simulate
+from taskset import TaskSet
 
 # -------------------- Page Configuration --------------------
 
@@ -18,153 +27,104 @@ st.write(
 # -------------------- Helper Functions --------------------
 
 
-def compute_utilization(tasks):
+# Simulations are cached per server process, shared by all sessions
+CACHE_ENTRIES = 64
+CACHE_TTL = 3600  # seconds
+
+# Rows per page of the raw schedule table
+PAGE_ROWS = 100
+
+# Longest horizon simulated in full; longer horizons need steady state
+MAX_SIM_TIME = 500
+
+# Most time units simulated while looking for steady state
+STEADY_STATE_BUDGET = 10**6
+
+# Single-core results are also kept on disk across restarts; set
+# SCHEDULER_RESULT_STORE to an empty string to disable
+RESULT_STORE_PATH = os.environ.get(
+    "SCHEDULER_RESULT_STORE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "results.sqlite3")
+)
+RESULT_STORE = ResultStore(RESULT_STORE_PATH) if RESULT_STORE_PATH else None
+
+
+def task_key(tasks):
     """
-    Compute total utilization of the task set as sum(C_i / T_i).
+    Normalized, hashable form of a TaskSet used as the cache key.
     """
-    total = 0.0
-    for t in tasks:
-        C = float(t["Execution Time"])
-        T = float(t["Period"])
-        if T > 0:
-            total += C / T
-    return total
+    return tuple(zip(tasks.names, tasks.C.tolist(), tasks.T.tolist(), tasks.D.tolist()))
 
 
-def simulate_scheduler(tasks, mode="Adaptive", sim_time=50, util_threshold=0.7):
+def tasks_from_key(key):
     """
-    Simulate real-time scheduling for the given task set.
-
-    Parameters:
-        tasks: list of dicts with keys:
-            Name, Execution Time, Period, Deadline
-        mode: "RMS", "EDF", or "Adaptive"
-        sim_time: total time units to simulate
-        util_threshold: threshold for adaptive switching
-
-    Returns:
-        schedule: list of (time, task_name)
-        total_misses: dict of task_name -> missed deadlines count
-        util_percent: simulated CPU utilization in %
-        U: theoretical utilization sum ΣC_i / T_i
-        used_algo: final algorithm used at the end of simulation
+    Rebuild the TaskSet from its cache key.
     """
-    # Precompute utilization
-    U = compute_utilization(tasks)
+    names, C, T, D = zip(*key) if key else ((), (), (), ())
+    return TaskSet(names, C, T, D)
 
-    # Decide base algorithm if Adaptive
-    if mode == "Adaptive":
-        if U <= util_threshold:
-            current_algo = "RMS"
-        else:
-            current_algo = "EDF"
-    else:
-        current_algo = mode
-
-    # Initialize runtime state for each task
-    state = {}
-    for t in tasks:
-        name = t["Name"]
-        C = int(t["Execution Time"])
-        T = int(t["Period"])
-        D = int(t["Deadline"])
-        state[name] = {
-            "C": C,
-            "T": T,
-            "D": D,
-            "next_release": 0,
-            "remaining": 0,
-            "abs_deadline": 0,
-            "misses": 0,
-        }
-
-    schedule = []
-    total_idle = 0
-    recent_misses = 0  # used for adaptive switching
-
-    for time in range(sim_time):
-        # Release jobs at the start of each time unit
-        for name, s in state.items():
-            if time >= s["next_release"]:
-                # If previous job is not finished and deadline passed -> miss
-                if s["remaining"] > 0 and time > s["abs_deadline"]:
-                    s["misses"] += 1
-                    recent_misses += 1
-                # Release new job
-                s["remaining"] = s["C"]
-                s["abs_deadline"] = time + s["D"]
-                s["next_release"] += s["T"]
-
-        # Collect ready tasks
-        ready = [name for name, s in state.items() if s["remaining"] > 0]
-
-        # Adaptive switching based on recent misses
-        if mode == "Adaptive":
-            # If too many misses recently, switch to EDF
-            if recent_misses >= 3:
-                current_algo = "EDF"
-
-        # If no task is ready, CPU is idle
-        if not ready:
-            schedule.append((time, "IDLE"))
-            total_idle += 1
-        else:
-            # Choose task according to current algorithm
-            if current_algo == "RMS":
-                # Choose task with smallest period
-                chosen = min(ready, key=lambda n: state[n]["T"])
-            else:  # EDF
-                # Choose task with earliest absolute deadline
-                chosen = min(ready, key=lambda n: state[n]["abs_deadline"])
 
-            schedule.append((time, chosen))
-            state[chosen]["remaining"] -= 1
+@st.cache_data(max_entries=CACHE_ENTRIES, ttl=CACHE_TTL, show_spinner="Simulating...")
+def run_simulation(key, mode, sim_time, util_threshold, steady_state, switching):
+    """
+    Single-core simulation, cached on the inputs. switching is the
+    (miss_window, miss_high, miss_low) of adaptive switching.
+    """
+    miss_window, miss_high, miss_low = switching
+    return cached_simulate(
+        RESULT_STORE,
+        tasks_from_key(key),
+        mode=mode,
+        sim_time=sim_time,
+        util_threshold=util_threshold,
+        steady_state=steady_state,
+        miss_window=miss_window,
+        miss_high=miss_high,
+        miss_low=miss_low
+    )
 
-    # Collect statistics
-    total_misses = {name: s["misses"] for name, s in state.items()}
-    util_percent = 100.0 * (1 - total_idle / sim_time)
 
-    return schedule, total_misses, util_percent, U, current_algo
+@st.cache_data(max_entries=CACHE_ENTRIES, ttl=CACHE_TTL, show_spinner="Simulating...")
+def run_multiprocessor(key, cores, scheme, mode, sim_time, util_threshold, heuristic):
+    """
+    Multi-core simulation, cached on the inputs.
+    """
+    return simulate_multiprocessor(
+        tasks_from_key(key),
+        m=cores,
+        scheme=scheme,
+        mode=mode,
+        sim_time=sim_time,
+        util_threshold=util_threshold,
+        heuristic=heuristic
+    )
 
 
-def plot_gantt(schedule):
+@st.cache_data(max_entries=CACHE_ENTRIES, ttl=CACHE_TTL, show_spinner="Drawing...")
+def gantt_charts(run, window):
     """
-    Plot a simple Gantt-like chart from the schedule list of (time, task_name).
+    Gantt chart (PNG bytes) of every core for a cached run, zoomed to the
+    (start, stop) window. run is the (function name, arguments) of the
+    cached simulation, so the schedules never need to be hashed.
     """
-    # Collect segments as (task, start, end)
-    segments = []
-    if not schedule:
-        return
-
-    current_task = schedule[0][1]
-    start_time = schedule[0][0]
-
-    for i in range(1, len(schedule)):
-        t, task = schedule[i]
-        prev_t, prev_task = schedule[i - 1]
-        if task != prev_task:
-            segments.append((prev_task, start_time, prev_t + 1))
-            start_time = t
-            current_task = task
-
-    # Append the last segment
-    last_time, last_task = schedule[-1]
-    segments.append((last_task, start_time, last_time + 1))
-
-    # Map tasks to y-axis positions
-    tasks = sorted(list({s[0] for s in segments}))
-    task_to_y = {task: i for i, task in enumerate(tasks)}
-
-    fig, ax = plt.subplots()
-    for task, start, end in segments:
-        y = task_to_y[task]
-        ax.barh(y, end - start, left=start)
-    ax.set_yticks(list(task_to_y.values()))
-    ax.set_yticklabels(tasks)
-    ax.set_xlabel("Time")
-    ax.set_ylabel("Task / IDLE")
-    ax.set_title("Schedule Gantt Chart")
-    st.pyplot(fig)
+    name, args = run
+    result = SIMULATIONS[name](*args)
+    schedules = result[0] if name == "multiprocessor" else [result[0]]
+    return [gantt_png(schedule, *window) for schedule in schedules]
+
+
+@st.cache_data(max_entries=CACHE_ENTRIES, ttl=CACHE_TTL, show_spinner=False)
+def gantt_tables(run, window):
+    """
+    Segment tables of every core for the interactive chart, like gantt_charts.
+    """
+    name, args = run
+    result = SIMULATIONS[name](*args)
+    schedules = result[0] if name == "multiprocessor" else [result[0]]
+    return [gantt_data(schedule, *window) for schedule in schedules]
+
+
+SIMULATIONS = {"single": run_simulation, "multiprocessor": run_multiprocessor}
 
 
 # -------------------- UI Layout --------------------
@@ -185,12 +145,23 @@ task_df = st.data_editor(df, num_rows="dynamic")
 
 col1, col2, col3 = st.columns(3)
 with col1:
-    mode = st.selectbox("Scheduling Mode", ["RMS", "EDF", "Adaptive"])
+    mode = st.selectbox(
+        "Scheduling Mode",
+        BUILTIN_MODES + [name for name in POLICIES if name not in BUILTIN_MODES]
+    )
 with col2:
+    # Steady-state detection only exists for the built-in modes
+    steady_state = st.checkbox(
+        "Stop at steady state and extrapolate (long horizons)",
+        help="Stops once the schedule repeats over a hyperperiod and "
+             "extrapolates misses and utilization to the full horizon. "
+             "Only for RMS, EDF and Adaptive.",
+        disabled=mode not in BUILTIN_MODES
+    ) and mode in BUILTIN_MODES
     sim_time = st.number_input(
         "Simulation Time (units)",
         min_value=10,
-        max_value=500,
+        max_value=10**12 if steady_state else MAX_SIM_TIME,
         value=50,
         step=10
     )
@@ -203,41 +174,125 @@ with col3:
         0.05
     )
 
+# Adaptive switching: EDF after miss_high misses, back to RMS at miss_low
+# misses within the window; a window of 0 makes the switch permanent
+switching = (None, 3, 0)
+if mode == "Adaptive":
+    col_w, col_h, col_l = st.columns(3)
+    with col_w:
+        miss_window = st.number_input(
+            "Miss Window (0 = switch to EDF for good)", min_value=0, value=0, step=10
+        )
+    with col_h:
+        miss_high = st.number_input("Switch to EDF at Misses", min_value=1, value=3)
+    with col_l:
+        miss_low = st.number_input(
+            "Back to RMS at Misses", min_value=0, max_value=miss_high - 1, value=0,
+            disabled=miss_window == 0
+        )
+    switching = (miss_window or None, miss_high, miss_low if miss_window else 0)
+
+col4, col5, col6 = st.columns(3)
+with col4:
+    cores = st.number_input("Number of Cores", min_value=1, max_value=64, value=1)
+with col5:
+    scheme = st.selectbox("Multiprocessor Scheduling", ["Global", "Partitioned"])
+with col6:
+    heuristic = st.selectbox("Partitioning Heuristic", HEURISTICS)
+
+# Keep showing the results on later reruns, e.g. when zooming the chart
 if st.button("Run Simulation"):
+    st.session_state["simulated"] = True
+
+if st.session_state.get("simulated"):
     try:
-        tasks = []
-        for _, row in task_df.iterrows():
-            name = str(row["Name"])
-            C = int(row["Execution Time"])
-            T = int(row["Period"])
-            D = int(row["Deadline"])
-            if C <= 0 or T <= 0 or D <= 0:
-                st.error("All task parameters must be positive.")
-                st.stop()
+        tasks = TaskSet.from_frame(task_df)
+        if (tasks.C <= 0).any() or (tasks.T <= 0).any() or (tasks.D <= 0).any():
+            st.error("All task parameters must be positive.")
+            st.stop()
+        for name, C, D in zip(tasks.names, tasks.C, tasks.D):
             if C > D:
                 st.warning(
                     f"Execution time is greater than deadline for task {name}. "
                     "This may cause deadline misses."
                 )
-            tasks.append(
-                {
-                    "Name": name,
-                    "Execution Time": C,
-                    "Period": T,
-                    "Deadline": D,
-                }
-            )
 
-        schedule, miss_dict, util_percent, U, used_algo = simulate_scheduler(
-            tasks,
-            mode=mode,
-            sim_time=sim_time,
-            util_threshold=util_threshold
-        )
+        # Inputs that cannot change the result are fixed, so that such runs
+        # share one cache entry
+        if mode != "Adaptive":
+            util_threshold = 0.7
+        if scheme != "Partitioned":
+            heuristic = HEURISTICS[0]
 
-        st.success(f"Simulation completed using algorithm: {used_algo}")
-        st.write(f"Total CPU Utilization (simulated): **{util_percent:.2f}%**")
-        st.write(f"Theoretical Utilization Sum (ΣC/T): **{U:.3f}**")
+        if cores > 1:
+            if steady_state:
+                st.error("Steady-state extrapolation is only available for one core.")
+                st.stop()
+            if switching != (None, 3, 0):
+                st.error("Adaptive switching options are only available for one core.")
+                st.stop()
+            run = ("multiprocessor", (task_key(tasks), cores, scheme.lower(), mode,
+                                      sim_time, util_threshold, heuristic))
+            result = run_multiprocessor(*run[1])
+            schedules, miss_dict, core_util, migrations, U, core_algos = result
+
+            st.success(
+                f"Simulation completed on {cores} cores ({scheme.lower()} scheduling)"
+            )
+            st.write(f"Theoretical Utilization Sum (ΣC/T): **{U:.3f}**")
+            st.write(f"Migrations: **{migrations}**")
+            st.table(pd.DataFrame({
+                "Core": range(cores),
+                "Utilization (%)": core_util,
+                "Algorithm": core_algos,
+            }))
+        else:
+            if steady_state and sim_time > MAX_SIM_TIME:
+                # The schedule can only repeat from one hyperperiod to the next
+                H = hyperperiod(tasks)
+                if 2 * H > STEADY_STATE_BUDGET:
+                    st.error(
+                        f"The hyperperiod ({H} units) is too long to reach steady state; "
+                        f"simulate at most {MAX_SIM_TIME} units instead."
+                    )
+                    st.stop()
+            if steady_state and sim_time > STEADY_STATE_BUDGET:
+                # Look for steady state within the budget first; the full horizon
+                # stops at the same point when it is found
+                prefix = run_simulation(task_key(tasks), mode, STEADY_STATE_BUDGET,
+                                        util_threshold, steady_state, switching)
+                if len(prefix[0]) == STEADY_STATE_BUDGET:
+                    st.warning(
+                        f"Steady state was not reached within {STEADY_STATE_BUDGET} "
+                        f"time units; results cover only the first {STEADY_STATE_BUDGET} "
+                        f"units instead of {sim_time}."
+                    )
+                    sim_time = STEADY_STATE_BUDGET
+            run = ("single", (task_key(tasks), mode, sim_time, util_threshold,
+                              steady_state, switching))
+            result = run_simulation(*run[1])
+            schedule, miss_dict, util_percent, U, used_algo = result
+            schedules = [schedule]
+
+            st.success(f"Simulation completed using algorithm: {used_algo}")
+            if len(schedule) < sim_time:
+                st.info(
+                    f"Steady state reached after {len(schedule)} time units; "
+                    f"results were extrapolated to {sim_time} units."
+                )
+            st.write(f"Total CPU Utilization (simulated): **{util_percent:.2f}%**")
+            st.write(f"Theoretical Utilization Sum (ΣC/T): **{U:.3f}**")
+            if mode == "Adaptive":
+                st.write("Algorithm switches:")
+                st.table(pd.DataFrame(schedule.switches, columns=["Time", "Algorithm"]))
+
+        if cores == 1:
+            st.subheader("Schedulability Analysis")
+            report_df = pd.DataFrame(schedulability_report(tasks))
+            report_df["Result"] = report_df["Result"].map(
+                {True: "Schedulable", False: "Not proven"}
+            )
+            st.table(report_df)
 
         st.subheader("Deadline Misses per Task")
         miss_df = pd.DataFrame(
@@ -246,11 +301,53 @@ if st.button("Run Simulation"):
         st.table(miss_df)
 
         st.subheader("Schedule Gantt Chart")
-        plot_gantt(schedule)
-
-        st.subheader("Raw Schedule (first 100 entries)")
-        sched_df = pd.DataFrame(schedule, columns=["Time", "Task"])
-        st.dataframe(sched_df.head(100))
+        # Long schedules are drawn binned; a narrower window shows every segment
+        horizon = max(len(core_schedule) for core_schedule in schedules)
+        window = (0, horizon)
+        if horizon > 1:
+            window = st.slider("Zoom (time window)", 0, horizon, (0, horizon))
+        renderer = st.radio(
+            "Renderer", ["Static image", "Interactive (in browser)"], horizontal=True,
+            help="The interactive chart is drawn by the browser and can be "
+                 "panned and zoomed with the mouse."
+        )
+        if renderer == "Static image":
+            charts = gantt_charts(run, window)
+        else:
+            charts = gantt_tables(run, window)
+        for core, chart in enumerate(charts):
+            if len(charts) > 1:
+                st.write(f"Core {core}")
+            if chart is None:
+                continue
+            if renderer == "Static image":
+                st.image(chart)
+            else:
+                st.altair_chart(gantt_altair(chart), width="stretch")
+
+        # Only the rows of the current page are built from the segments
+        st.subheader("Raw Schedule")
+        col7, col8, col9, col10 = st.columns(4)
+        with col7:
+            core = st.number_input("Core", min_value=0, max_value=len(schedules) - 1,
+                                   value=0, disabled=len(schedules) == 1)
+        core_schedule = schedules[core]
+        with col8:
+            offset = st.number_input("Start at time", min_value=0,
+                                     max_value=max(len(core_schedule) - 1, 0), value=0)
+        with col9:
+            task_filter = st.selectbox("Task", ["All"] + tasks.names + ["IDLE"])
+        task = None if task_filter == "All" else task_filter
+        end = len(core_schedule)
+        if task is None:
+            total_rows = max(end - offset, 0)
+        else:
+            total_rows = core_schedule.count(task, offset, end)
+        pages = max(1, -(-total_rows // PAGE_ROWS))
+        with col10:
+            page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, value=1)
+        rows = core_schedule.page(offset, (page - 1) * PAGE_ROWS, PAGE_ROWS, task)
+        st.dataframe(pd.DataFrame(rows, columns=["Time", "Task"]))
 
     except Exception as e:
         st.error(f"Error during simulation: {e}")
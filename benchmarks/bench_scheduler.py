@@ -0,0 +1,205 @@
+"""
+Throughput and memory benchmarks for the scheduler.
+
+Covers simulate_scheduler (every mode, task counts from 3 to 10,000 and
+horizons from 50 to 10^8 ticks), compute_utilization and the Gantt chart.
+Each benchmark reports the best wall time, simulated ticks per second and
+peak traced memory, and is compared with the stored baseline.
+
+    python benchmarks/bench_scheduler.py                  # quick grid vs. baseline
+    python benchmarks/bench_scheduler.py --full           # full grid
+    python benchmarks/bench_scheduler.py --save-baseline  # store a new baseline
+
+The exit status is 1 if a benchmark is slower than its baseline by more than
+the tolerance, or its peak memory grew by more than the memory tolerance.
+Baselines are machine specific: save a new one after moving
+to different hardware.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import matplotlib  # noqa: E402
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+
+from gantt import gantt_figure  # noqa: E402
+from generators import generate_task_sets, to_task_sets  # noqa: E402
+from scheduler import compute_utilization, simulate_scheduler  # noqa: E402
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+MODES = ["RMS", "EDF", "Adaptive"]
+QUICK_TASKS = [3, 30, 300]
+QUICK_HORIZONS = [50, 10_000, 1_000_000]
+FULL_TASKS = [3, 10, 100, 1000, 10_000]
+FULL_HORIZONS = [50, 10_000, 1_000_000, 100_000_000]
+
+
+def make_task_set(n_tasks, seed=0):
+    """
+    Reproducible task set with total utilization 0.7.
+    """
+    C, T, D = generate_task_sets(
+        1, n_tasks, 0.7, period_min=1000, period_max=1_000_000, seed=seed
+    )
+    return to_task_sets(C, T, D)[0]
+
+
+def estimated_events(task_set, horizon):
+    """
+    Number of job releases within the horizon, a proxy for simulation cost.
+    """
+    return int(sum(horizon // t + 1 for t in task_set.T.tolist()))
+
+
+def measure(func, repeat):
+    """
+    Best wall time over repeat runs, plus peak traced memory of one extra run.
+    """
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+        if best > 1.0:
+            break
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak / 2**20, result
+
+
+def run_benchmarks(task_counts, horizons, max_events, max_segments, repeat):
+    results = {}
+    for n_tasks in task_counts:
+        task_set = make_task_set(n_tasks)
+        records = task_set.to_records()
+
+        seconds, peak_mb, _ = measure(lambda: compute_utilization(records), repeat)
+        results[f"compute_utilization/n={n_tasks}"] = {
+            "seconds": seconds, "peak_mb": peak_mb,
+        }
+
+        for horizon in horizons:
+            if estimated_events(task_set, horizon) > max_events:
+                print(f"skip n={n_tasks} horizon={horizon}: more than {max_events} releases")
+                continue
+            for mode in MODES:
+                seconds, peak_mb, out = measure(
+                    lambda: simulate_scheduler(task_set, mode=mode, sim_time=horizon),
+                    repeat,
+                )
+                schedule = out[0]
+                results[f"simulate/{mode}/n={n_tasks}/h={horizon}"] = {
+                    "seconds": seconds,
+                    "ticks_per_sec": horizon / seconds,
+                    "peak_mb": peak_mb,
+                    "segments": len(schedule.segments),
+                }
+
+            if len(schedule.segments) <= max_segments:
+                def draw():
+                    plt.close(gantt_figure(schedule))
+                seconds, peak_mb, _ = measure(draw, repeat)
+                results[f"gantt/n={n_tasks}/h={horizon}"] = {
+                    "seconds": seconds,
+                    "peak_mb": peak_mb,
+                    "segments": len(schedule.segments),
+                }
+    return results
+
+
+def compare(results, baseline, tolerance, min_seconds, memory_tolerance, min_mb):
+    """
+    Print current vs. baseline times and peak memory and return the regressed
+    benchmark names. Benchmarks faster than min_seconds, or using less than
+    min_mb, are too noisy to flag for time or memory respectively.
+    """
+    regressions = []
+    print(f"{'benchmark':45} {'seconds':>10} {'baseline':>10} {'ratio':>7} {'ticks/s':>12} "
+          f"{'peak MB':>8} {'baseline':>8}")
+    for name, r in results.items():
+        base = baseline.get(name)
+        ratio = r["seconds"] / base["seconds"] if base else float("nan")
+        flags = []
+        if base and ratio > 1 + tolerance and r["seconds"] > min_seconds:
+            flags.append("TIME")
+        if (base and r["peak_mb"] > base["peak_mb"] * (1 + memory_tolerance)
+                and r["peak_mb"] > min_mb):
+            flags.append("MEMORY")
+        if flags:
+            regressions.append(name)
+        print(
+            f"{name:45} {r['seconds']:10.4f} "
+            f"{base['seconds'] if base else float('nan'):10.4f} {ratio:7.2f} "
+            f"{r.get('ticks_per_sec', float('nan')):12.0f} {r['peak_mb']:8.2f} "
+            f"{base['peak_mb'] if base else float('nan'):8.2f}"
+            + (f"  REGRESSION ({', '.join(flags)})" if flags else "")
+        )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the scheduler.")
+    parser.add_argument("--full", action="store_true", help="run the full grid")
+    parser.add_argument("--max-events", type=int, default=2_000_000,
+                        help="skip simulations with more job releases than this")
+    parser.add_argument("--max-segments", type=int, default=20_000,
+                        help="skip Gantt charts with more segments than this")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown vs. baseline (0.25 = 25%%)")
+    parser.add_argument("--min-seconds", type=float, default=0.05,
+                        help="never flag benchmarks faster than this")
+    parser.add_argument("--memory-tolerance", type=float, default=0.25,
+                        help="allowed peak memory growth vs. baseline (0.25 = 25%%)")
+    parser.add_argument("--min-mb", type=float, default=1.0,
+                        help="never flag memory of benchmarks using less than this")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--baseline", default=BASELINE)
+    args = parser.parse_args(argv)
+
+    task_counts = FULL_TASKS if args.full else QUICK_TASKS
+    horizons = FULL_HORIZONS if args.full else QUICK_HORIZONS
+    results = run_benchmarks(task_counts, horizons, args.max_events,
+                             args.max_segments, args.repeat)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+    regressions = compare(results, baseline, args.tolerance, args.min_seconds,
+                          args.memory_tolerance, args.min_mb)
+
+    if args.save_baseline:
+        baseline.update(results)
+        with open(args.baseline, "w") as f:
+            json.dump({
+                "machine": platform.platform(),
+                "python": platform.python_version(),
+                "results": baseline,
+            }, f, indent=2, sort_keys=True)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) slower or larger than baseline: "
+              f"{', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
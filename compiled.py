@@ -0,0 +1,103 @@
+"""
+Compiled tick engine.
+
+The tick-by-tick simulation loop of the scheduler's reference engine,
+rewritten over NumPy arrays so that Numba can compile it. Numba is optional:
+when it is not installed, AVAILABLE is False and scheduler.py falls back to
+the pure-Python tick engine, which gives the same results.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+AVAILABLE = njit is not None
+
+RMS, EDF, ADAPTIVE = 0, 1, 2
+
+
+def _tick_loop(C, T, D, mode, start_rms, sim_time):
+    """
+    Same semantics as scheduler._simulate_ticks, one time unit at a time.
+
+    Parameters:
+        C, T, D: int64 arrays of task parameters
+        mode: RMS, EDF or ADAPTIVE
+        start_rms: True if the simulation starts with RMS
+        sim_time: total time units to simulate
+
+    Returns:
+        seg_task, seg_start, seg_end: arrays of the merged schedule segments;
+            task -1 is IDLE
+        misses: missed deadlines count per task
+        total_idle: idle time units
+        switch_time: time of the switch from RMS to EDF, or -1
+    """
+    n = C.shape[0]
+    remaining = np.zeros(n, np.int64)
+    abs_deadline = np.zeros(n, np.int64)
+    next_release = np.zeros(n, np.int64)
+    misses = np.zeros(n, np.int64)
+    rms = start_rms
+    switch_time = -1
+    recent_misses = 0
+    total_idle = 0
+
+    capacity = 1024
+    seg_task = np.empty(capacity, np.int64)
+    seg_start = np.empty(capacity, np.int64)
+    seg_end = np.empty(capacity, np.int64)
+    count = 0
+
+    for time in range(sim_time):
+        # Release jobs at the start of each time unit
+        for i in range(n):
+            if time >= next_release[i]:
+                if remaining[i] > 0 and time > abs_deadline[i]:
+                    misses[i] += 1
+                    recent_misses += 1
+                remaining[i] = C[i]
+                abs_deadline[i] = time + D[i]
+                next_release[i] += T[i]
+
+        if mode == ADAPTIVE and recent_misses >= 3 and rms:
+            rms = False
+            switch_time = time
+
+        # Smallest key wins, ties go to the first task
+        chosen = -1
+        best = 0
+        for i in range(n):
+            if remaining[i] > 0:
+                k = T[i] if rms else abs_deadline[i]
+                if chosen == -1 or k < best:
+                    chosen = i
+                    best = k
+        if chosen == -1:
+            total_idle += 1
+        else:
+            remaining[chosen] -= 1
+
+        if count > 0 and seg_task[count - 1] == chosen:
+            seg_end[count - 1] = time + 1
+        else:
+            if count == capacity:
+                capacity *= 2
+                seg_task = np.concatenate((seg_task, np.empty(capacity - count, np.int64)))
+                seg_start = np.concatenate((seg_start, np.empty(capacity - count, np.int64)))
+                seg_end = np.concatenate((seg_end, np.empty(capacity - count, np.int64)))
+            seg_task[count] = chosen
+            seg_start[count] = time
+            seg_end[count] = time + 1
+            count += 1
+
+    return seg_task[:count], seg_start[:count], seg_end[:count], misses, total_idle, switch_time
+
+
+if AVAILABLE:
+    tick_loop = njit(cache=True)(_tick_loop)
+else:
+    tick_loop = None
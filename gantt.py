@@ -0,0 +1,206 @@
+"""
+Gantt chart rendering for simulated schedules.
+
+Kept separate from app.py so charts can be built (and benchmarked) without
+a running Streamlit session.
+
+Long schedules are drawn at the resolution of the chart: when a time window
+holds more segments than the axes are pixels wide, the window is split into
+one time bin per pixel and every task row shows the share of each bin during
+which the task ran. Zooming into a narrower window (start, stop) brings back
+the individual segments.
+
+gantt_png rasterizes the chart on the server with matplotlib. gantt_altair
+instead builds a vega-lite chart that the browser draws from a compact
+table of segments (or bins), with pan and zoom on the time axis.
+"""
+
+import io
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+IDLE = "IDLE"
+IDLE_COLOR = "lightgray"
+BAR_HEIGHT = 0.8
+
+# Most rows sent to the browser per chart; longer windows are binned
+MAX_CLIENT_ROWS = 5000
+
+
+def occupancy(schedule, start, stop, bins):
+    """
+    Share of every time bin during which each task ran.
+
+    Parameters:
+        schedule: Schedule to aggregate
+        start, stop: time window [start, stop) to aggregate
+        bins: number of equal-width time bins
+
+    Returns:
+        edges: array of bins + 1 bin edges
+        tasks: sorted task names that ran in the window
+        occ: array of shape (len(tasks), bins) with values in [0, 1]
+    """
+    edges = np.linspace(start, stop, bins + 1)
+    segments = schedule.window(start, stop).segments
+    if not segments:
+        return edges, [], np.zeros((0, bins))
+
+    names, starts, ends = zip(*segments)
+    tasks = sorted(set(names))
+    task_to_row = {task: row for row, task in enumerate(tasks)}
+    rows = np.array([task_to_row[name] for name in names])
+    starts = np.array(starts, dtype=float)
+    lengths = np.array(ends, dtype=float) - starts
+
+    occ = np.empty((len(tasks), bins))
+    for row in range(len(tasks)):
+        mask = rows == row
+        s = starts[mask]
+        length = lengths[mask]
+        # Time the task has run up to every edge: the segments that ended
+        # before it, plus the part of the segment the edge falls into
+        done = np.concatenate(([0.0], np.cumsum(length)))
+        i = np.searchsorted(s + length, edges, side="right")
+        s = np.append(s, np.inf)
+        length = np.append(length, 0.0)
+        busy = done[i] + np.clip(edges - s[i], 0.0, length[i])
+        occ[row] = np.diff(busy) / np.diff(edges)
+    return edges, tasks, occ
+
+
+def _task_color(task, y, colors):
+    if task == IDLE:
+        return IDLE_COLOR
+    return colors[y % len(colors)]
+
+
+def gantt_figure(schedule, start=None, stop=None, max_bins=None):
+    """
+    Build a Gantt-like chart of the schedule's (task, start, end) segments.
+
+    Parameters:
+        schedule: Schedule to draw
+        start, stop: optional time window to zoom into (default: everything)
+        max_bins: most segments drawn individually before the window is
+            binned (default: the width of the axes in pixels)
+
+    Returns the figure, or None when nothing ran in the window.
+    """
+    window = schedule.window(start, stop)
+    segments = window.segments
+    if not segments:
+        return None
+    start, stop = segments[0][1], segments[-1][2]
+
+    colors = plt.rcParams["axes.prop_cycle"].by_key()["color"]
+    fig, ax = plt.subplots()
+    if max_bins is None:
+        max_bins = max(1, int(ax.bbox.width))
+
+    if len(segments) <= max_bins:
+        # Group the segments into one row of (start, width) spans per task
+        rows = {}
+        for task, seg_start, seg_end in segments:
+            rows.setdefault(task, []).append((seg_start, seg_end - seg_start))
+        tasks = sorted(rows)
+        task_to_y = {task: i for i, task in enumerate(tasks)}
+
+        # One collection per row, so drawing cost grows with the number of tasks
+        for task, spans in rows.items():
+            y = task_to_y[task]
+            ax.broken_barh(spans, (y - BAR_HEIGHT / 2, BAR_HEIGHT),
+                           facecolors=_task_color(task, y, colors))
+        ax.set_xlabel("Time")
+    else:
+        bins = min(max_bins, stop - start)
+        edges, tasks, occ = occupancy(window, start, stop, bins)
+        task_to_y = {task: i for i, task in enumerate(tasks)}
+
+        # Bar height within a bin is the share of the bin the task ran
+        for task, share in zip(tasks, occ):
+            y = task_to_y[task]
+            bottom = y - BAR_HEIGHT / 2
+            ax.fill_between(edges, bottom, bottom + BAR_HEIGHT * np.append(share, share[-1]),
+                            step="post", linewidth=0, color=_task_color(task, y, colors))
+        ax.set_xlabel(f"Time ({(stop - start) / bins:g} units per bin)")
+
+    ax.set_xlim(start, stop)
+    ax.set_ylim(-0.5, len(tasks) - 0.5)
+    ax.set_yticks(list(task_to_y.values()))
+    ax.set_yticklabels(tasks)
+    ax.set_ylabel("Task / IDLE")
+    ax.set_title("Schedule Gantt Chart")
+    return fig
+
+
+def gantt_png(schedule, start=None, stop=None, max_bins=None):
+    """
+    Render the Gantt chart of a schedule to PNG bytes (None when nothing ran
+    in the window). The figure is closed, so only the bytes are kept.
+    """
+    fig = gantt_figure(schedule, start, stop, max_bins)
+    if fig is None:
+        return None
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png")
+    plt.close(fig)
+    return buf.getvalue()
+
+
+# -------------------- Client-Side Rendering --------------------
+
+
+def gantt_data(schedule, start=None, stop=None, max_rows=MAX_CLIENT_ROWS):
+    """
+    Compact table of what to draw for a time window of the schedule.
+
+    Returns a DataFrame with Task, Start, End and Share columns: one row per
+    segment when the window holds at most max_rows segments, otherwise one
+    row per task and time bin the task ran in, with Share the fraction of
+    the bin it ran. Returns None when nothing ran in the window.
+    """
+    window = schedule.window(start, stop)
+    segments = window.segments
+    if not segments:
+        return None
+    if len(segments) <= max_rows:
+        data = pd.DataFrame(segments, columns=["Task", "Start", "End"])
+        data["Share"] = 1.0
+        return data
+
+    # Keep about max_rows non-empty (task, bin) cells
+    start, stop = segments[0][1], segments[-1][2]
+    n_tasks = len({task for task, _, _ in segments})
+    bins = max(1, min(max_rows // n_tasks, stop - start))
+    edges, tasks, occ = occupancy(window, start, stop, bins)
+    rows, cols = np.nonzero(occ)
+    return pd.DataFrame({
+        "Task": np.array(tasks, dtype=object)[rows],
+        "Start": edges[cols],
+        "End": edges[cols + 1],
+        "Share": occ[rows, cols],
+    })
+
+
+def gantt_altair(data):
+    """
+    Interactive vega-lite Gantt chart of a gantt_data table, drawn in the
+    browser. Dragging pans and scrolling zooms the time axis.
+    """
+    import altair as alt  # only needed for the interactive chart
+
+    tasks = sorted(data["Task"].unique())
+    colors = plt.rcParams["axes.prop_cycle"].by_key()["color"]
+    palette = [_task_color(task, y, colors) for y, task in enumerate(tasks)]
+    return alt.Chart(data).mark_bar().encode(
+        x=alt.X("Start:Q", title="Time"),
+        x2="End:Q",
+        y=alt.Y("Task:N", sort=tasks, title="Task / IDLE"),
+        color=alt.Color("Task:N", scale=alt.Scale(domain=tasks, range=palette), legend=None),
+        opacity=alt.Opacity("Share:Q", scale=alt.Scale(domain=[0, 1], range=[0.2, 1]),
+                            legend=None),
+        tooltip=["Task", "Start", "End", "Share"],
+    ).properties(title="Schedule Gantt Chart").interactive(bind_y=False)
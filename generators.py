@@ -0,0 +1,191 @@
+"""
+Synthetic task set generation.
+
+Utilizations are drawn with UUniFast, UUniFast-discard or Randfixedsum, and
+periods from a log-uniform or harmonic distribution. Every generator works
+on whole (n_sets, n_tasks) arrays at once and takes a seed, so large
+benchmarks are fast and reproducible.
+
+The C, T, D arrays returned by generate_task_sets can be passed directly to
+batch.simulate_batch, or turned into TaskSet objects with to_task_sets.
+"""
+
+import numpy as np
+
+from taskset import TaskSet
+
+UTILIZATION_METHODS = ["uunifast", "uunifast-discard", "randfixedsum"]
+
+
+# -------------------- Utilizations --------------------
+
+
+def uunifast(n_sets, n_tasks, utilization, rng=None):
+    """
+    UUniFast (Bini & Buttazzo): n_tasks utilizations per set summing to
+    utilization, uniformly distributed over the valid simplex.
+    """
+    rng = np.random.default_rng(rng)
+    u = np.empty((n_sets, n_tasks))
+    remaining = np.full(n_sets, float(utilization))
+    for i in range(n_tasks - 1):
+        next_remaining = remaining * rng.random(n_sets) ** (1.0 / (n_tasks - 1 - i))
+        u[:, i] = remaining - next_remaining
+        remaining = next_remaining
+    if n_tasks:
+        u[:, -1] = remaining
+    return u
+
+
+def uunifast_discard(n_sets, n_tasks, utilization, rng=None):
+    """
+    UUniFast-discard (Davis & Burns): UUniFast for total utilizations above 1,
+    discarding sets in which a task has a utilization above 1.
+    """
+    rng = np.random.default_rng(rng)
+    if utilization > n_tasks:
+        raise ValueError("Utilization cannot exceed the number of tasks.")
+    accepted = []
+    count = 0
+    while count < n_sets:
+        u = uunifast(max(n_sets - count, 16), n_tasks, utilization, rng)
+        u = u[(u <= 1).all(axis=1)]
+        accepted.append(u)
+        count += len(u)
+    return np.concatenate(accepted)[:n_sets]
+
+
+def randfixedsum(n_sets, n_tasks, utilization, rng=None):
+    """
+    Randfixedsum (Stafford; Emberson et al.): n_tasks utilizations in [0, 1]
+    per set summing to utilization, uniformly distributed. Unlike
+    UUniFast-discard it never rejects sets, which matters when the total
+    utilization is close to n_tasks.
+    """
+    rng = np.random.default_rng(rng)
+    n, s = n_tasks, float(utilization)
+    if not 0 <= s <= n:
+        raise ValueError("Utilization must be between 0 and the number of tasks.")
+    if n == 0:
+        return np.empty((n_sets, 0))
+    if n == 1:
+        return np.full((n_sets, 1), s)
+
+    # Transition probabilities between the simplexes that tile the hypercube
+    k = min(int(s), n - 1)
+    s1 = s - np.arange(k, k - n, -1.0)
+    s2 = np.arange(k + n, k, -1.0) - s
+    tiny = np.finfo(float).tiny
+    huge = np.finfo(float).max
+    w = np.zeros((n, n + 1))
+    w[0, 1] = huge
+    t = np.zeros((n - 1, n))
+    for i in range(2, n + 1):
+        tmp1 = w[i - 2, 1:i + 1] * s1[:i] / i
+        tmp2 = w[i - 2, :i] * s2[n - i:n] / i
+        w[i - 1, 1:i + 1] = tmp1 + tmp2
+        tmp3 = w[i - 1, 1:i + 1] + tiny
+        tmp4 = s2[n - i:n] > s1[:i]
+        t[i - 2, :i] = (tmp2 / tmp3) * tmp4 + (1 - tmp1 / tmp3) * ~tmp4
+
+    # Walk down the dimensions for every set at once
+    x = np.zeros((n_sets, n))
+    rt = rng.random((n_sets, n - 1))  # which simplex to move into
+    rs = rng.random((n_sets, n - 1))  # position inside the simplex
+    s_left = np.full(n_sets, s)
+    j = np.full(n_sets, k + 1)
+    sm = np.zeros(n_sets)
+    pr = np.ones(n_sets)
+    for i in range(n - 1, 0, -1):
+        e = rt[:, n - i - 1] <= t[i - 1, j - 1]
+        sx = rs[:, n - i - 1] ** (1.0 / i)
+        sm = sm + (1.0 - sx) * pr * s_left / (i + 1)
+        pr = sx * pr
+        x[:, n - i - 1] = sm + pr * e
+        s_left = s_left - e
+        j = j - e
+    x[:, n - 1] = sm + pr * s_left
+
+    # The walk fills the columns in a fixed order; shuffle each row
+    order = rng.random((n_sets, n)).argsort(axis=1)
+    return np.take_along_axis(x, order, axis=1)
+
+
+# -------------------- Periods --------------------
+
+
+def log_uniform_periods(n_sets, n_tasks, period_min, period_max, granularity=1, rng=None):
+    """
+    Periods drawn log-uniformly from [period_min, period_max] and rounded
+    down to a multiple of granularity.
+    """
+    rng = np.random.default_rng(rng)
+    r = rng.uniform(np.log(period_min), np.log(period_max + granularity),
+                    size=(n_sets, n_tasks))
+    periods = np.floor(np.exp(r) / granularity) * granularity
+    return np.clip(periods, period_min, period_max).astype(np.int64)
+
+
+def harmonic_periods(n_sets, n_tasks, period_min, period_max, rng=None):
+    """
+    Harmonic periods period_min * 2^k no larger than period_max, so every
+    period divides every longer one and the hyperperiod is period_max at most.
+    """
+    rng = np.random.default_rng(rng)
+    max_exp = int(np.floor(np.log2(period_max / period_min)))
+    exps = rng.integers(0, max_exp + 1, size=(n_sets, n_tasks))
+    return (period_min * (2 ** exps)).astype(np.int64)
+
+
+# -------------------- Task Sets --------------------
+
+
+def generate_task_sets(n_sets, n_tasks, utilization, method="uunifast",
+                       period_min=10, period_max=1000, harmonic=False,
+                       constrained_deadlines=False, seed=None):
+    """
+    Generate random task sets with a target total utilization.
+
+    Parameters:
+        n_sets: number of task sets
+        n_tasks: tasks per set
+        utilization: target total utilization of every set
+        method: "uunifast", "uunifast-discard" or "randfixedsum"
+        period_min, period_max: period range
+        harmonic: draw harmonic periods instead of log-uniform ones
+        constrained_deadlines: draw D uniformly from [C, T] instead of D = T
+        seed: seed or numpy Generator, for reproducible output
+
+    Returns:
+        C, T, D: int64 arrays of shape (n_sets, n_tasks). Execution times are
+            rounded to whole time units (at least 1), so the utilization of a
+            set is close to, not exactly, the target.
+    """
+    rng = np.random.default_rng(seed)
+    if method == "uunifast":
+        u = uunifast(n_sets, n_tasks, utilization, rng)
+    elif method == "uunifast-discard":
+        u = uunifast_discard(n_sets, n_tasks, utilization, rng)
+    elif method == "randfixedsum":
+        u = randfixedsum(n_sets, n_tasks, utilization, rng)
+    else:
+        raise ValueError(f"Unknown utilization method: {method}")
+
+    if harmonic:
+        T = harmonic_periods(n_sets, n_tasks, period_min, period_max, rng)
+    else:
+        T = log_uniform_periods(n_sets, n_tasks, period_min, period_max, rng=rng)
+    C = np.maximum(1, np.rint(u * T)).astype(np.int64)
+    if constrained_deadlines:
+        D = rng.integers(np.minimum(C, T), T, endpoint=True)
+    else:
+        D = T.copy()
+    return C, T, D
+
+
+def to_task_sets(C, T, D):
+    """
+    Convert generated arrays into a list of TaskSet objects named T1..Tn.
+    """
+    names = [f"T{i + 1}" for i in range(np.shape(C)[1])]
+    return [TaskSet(names, c, t, d) for c, t, d in zip(C, T, D)]
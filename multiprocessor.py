@@ -0,0 +1,262 @@
+"""
+Multiprocessor scheduling on m identical cores.
+
+Two approaches are supported:
+
+    - global scheduling: one ready queue, the m highest-priority ready jobs
+      run at every moment and jobs may migrate between cores
+    - partitioned scheduling: tasks are assigned to cores once by a
+      bin-packing heuristic and every core is simulated on its own
+"""
+
+from admission import AdmissionController
+from policies import Job, PriorityPolicy, get_policy
+from scheduler import (BUILTIN_MODES, JobReleases, ReadyQueue, Schedule,
+                       compute_utilization, simulate_scheduler)
+from taskset import as_task_set
+
+HEURISTICS = ["first-fit", "best-fit", "worst-fit"]
+
+
+# -------------------- Global Scheduling --------------------
+
+
+def _simulate_global(tasks, m, mode, sim_time, util_threshold):
+    """
+    Event-driven global RMS / EDF / Adaptive simulation on m cores.
+
+    Pluggable policies that rank jobs by a fixed key (PriorityPolicy, e.g.
+    DM or FIFO) are also supported: the m jobs with the smallest keys run.
+
+    Jobs that keep running stay on their core. A job that is dispatched again
+    after a preemption goes back to its previous core when that core is free;
+    otherwise it takes the lowest free core and counts as a migration.
+    """
+    policy = None
+    if not (isinstance(mode, str) and mode in BUILTIN_MODES):
+        policy = get_policy(mode)
+        if not isinstance(policy, PriorityPolicy):
+            raise ValueError("Global scheduling supports RMS, EDF, Adaptive and "
+                             "fixed-key priority policies only.")
+    U = compute_utilization(tasks)
+    # The adaptive threshold is compared with the utilization per core
+    if mode == "Adaptive":
+        current_algo = "RMS" if U / m <= util_threshold else "EDF"
+    elif policy is not None:
+        current_algo = mode if isinstance(mode, str) else policy.name
+    else:
+        current_algo = mode
+    ts = as_task_set(tasks)
+    if (ts.T <= 0).any():
+        raise ValueError("Task periods must be positive.")
+
+    n = len(ts)
+    names = ts.names
+    releases = JobReleases(ts)
+    T = releases.T
+    remaining = releases.remaining
+    abs_deadline = releases.abs_deadline
+    last_core = [None] * n  # core the current job last ran on
+
+    key = T if current_algo == "RMS" else abs_deadline
+    if policy is not None:
+        key = [None] * n  # policy key of every task's current job
+    ready = ReadyQueue()
+
+    schedules = [Schedule() for _ in range(m)]
+    busy = [0] * m
+    running = [None] * m  # task index running on each core
+    migrations = 0
+    recent_misses = 0
+    now = 0
+
+    while now < sim_time:
+        # Release every job that is due at the current time
+        for i, missed in releases.due(now):
+            if missed:
+                recent_misses += 1
+            last_core[i] = None
+            if policy is not None:
+                key[i] = policy.key(Job(i, names[i], now, abs_deadline[i], remaining[i],
+                                        T[i], releases.D[i]))
+            if remaining[i] > 0:
+                ready.push(i, (key[i], i))
+            elif i in ready:
+                ready.remove(i)
+
+        if mode == "Adaptive" and recent_misses >= 3 and current_algo != "EDF":
+            current_algo = "EDF"
+            key = abs_deadline
+            for i in ready.tasks():
+                ready.update(i, (key[i], i))
+
+        next_event = min(releases.next_time(sim_time), sim_time)
+
+        # The m highest-priority ready jobs run
+        chosen = [ready.pop() for _ in range(min(m, len(ready)))]
+        for i in chosen:
+            ready.push(i, (key[i], i))
+        chosen_set = set(chosen)
+
+        # Keep running jobs in place, then place the others on free cores
+        for core in range(m):
+            if running[core] not in chosen_set:
+                running[core] = None
+        placed = set(running)
+        free = [core for core in range(m) if running[core] is None]
+        waiting = []
+        for i in chosen:
+            if i in placed:
+                continue
+            if last_core[i] in free:
+                running[last_core[i]] = i
+                free.remove(last_core[i])
+            else:
+                waiting.append(i)
+        for i in waiting:
+            core = free.pop(0)
+            if last_core[i] is not None:
+                migrations += 1
+            running[core] = i
+
+        # Run until the next release or the first completion
+        end = next_event
+        for i in chosen:
+            end = min(end, now + remaining[i])
+        for core in range(m):
+            i = running[core]
+            if i is None:
+                schedules[core].append("IDLE", now, end)
+                continue
+            schedules[core].append(names[i], now, end)
+            busy[core] += end - now
+            last_core[i] = core
+            remaining[i] -= end - now
+            if remaining[i] == 0:
+                ready.remove(i)
+                running[core] = None
+        now = end
+
+    total_misses = dict(zip(names, releases.misses))
+    core_util = [100.0 * (1 - (sim_time - b) / sim_time) for b in busy]
+
+    return schedules, total_misses, core_util, migrations, U, [current_algo] * m
+
+
+# -------------------- Partitioned Scheduling --------------------
+
+
+def partition_tasks(tasks, m, heuristic="first-fit", policy="EDF"):
+    """
+    Assign tasks to m cores with a decreasing-utilization bin-packing heuristic.
+
+    A task fits on a core if the core's task set stays schedulable under
+    policy ("RMS", "DM" or "EDF"), checked with an AdmissionController per
+    core.
+
+    Parameters:
+        tasks: TaskSet or list of task dicts
+        m: number of cores
+        heuristic: "first-fit" (lowest-numbered core that fits), "best-fit"
+            (fitting core with the highest utilization) or "worst-fit"
+            (fitting core with the lowest utilization)
+        policy: schedulability test used on every core
+
+    Returns:
+        cores: list of m lists of task dicts
+        unassigned: list of task dicts that fit on no core
+    """
+    if heuristic not in HEURISTICS:
+        raise ValueError(f"Unknown partitioning heuristic: {heuristic}")
+    records = as_task_set(tasks).to_records()
+    records.sort(key=lambda t: t["Execution Time"] / t["Period"], reverse=True)
+
+    controllers = [AdmissionController(policy) for _ in range(m)]
+    cores = [[] for _ in range(m)]
+    unassigned = []
+    for t in records:
+        # Tasks that need no CPU time fit anywhere and are not analysed,
+        # as in analysis.py
+        needs_cpu = t["Execution Time"] > 0
+        fitting = [c for c in range(m) if not needs_cpu or controllers[c].can_admit(t)]
+        if not fitting:
+            unassigned.append(t)
+            continue
+        if heuristic == "first-fit":
+            core = fitting[0]
+        elif heuristic == "best-fit":
+            core = max(fitting, key=lambda c: controllers[c].utilization)
+        else:  # worst-fit
+            core = min(fitting, key=lambda c: controllers[c].utilization)
+        if needs_cpu:
+            controllers[core].add(t)
+        cores[core].append(t)
+    return cores, unassigned
+
+
+def _simulate_partitioned(tasks, m, mode, sim_time, util_threshold, heuristic):
+    """
+    Partition the tasks, then simulate every core with simulate_scheduler.
+
+    Tasks that fit on no core are placed on the least-utilized core anyway, so
+    their deadline misses show up in the results.
+    """
+    policy = mode if mode in ("RMS", "DM") else "EDF"
+    cores, unassigned = partition_tasks(tasks, m, heuristic, policy)
+    for t in unassigned:
+        core = min(range(m), key=lambda c: compute_utilization(cores[c]))
+        cores[core].append(t)
+
+    schedules = []
+    total_misses = {}
+    core_util = []
+    used_algo = []
+    for core_tasks in cores:
+        schedule, misses, util_percent, _, algo = simulate_scheduler(
+            core_tasks, mode=mode, sim_time=sim_time, util_threshold=util_threshold
+        )
+        schedules.append(schedule)
+        total_misses.update(misses)
+        core_util.append(util_percent)
+        used_algo.append(algo)
+
+    # Report misses in the original task order
+    total_misses = {name: total_misses[name] for name in as_task_set(tasks).names}
+    U = compute_utilization(tasks)
+
+    return schedules, total_misses, core_util, 0, U, used_algo
+
+
+def simulate_multiprocessor(tasks, m=2, scheme="global", mode="EDF", sim_time=50,
+                            util_threshold=0.7, heuristic="first-fit"):
+    """
+    Simulate real-time scheduling on m identical cores.
+
+    Parameters:
+        tasks: TaskSet, or list of dicts with keys:
+            Name, Execution Time, Period, Deadline
+        m: number of cores
+        scheme: "global" or "partitioned"
+        mode: "RMS", "EDF", or "Adaptive", or a pluggable policy; global
+            scheduling only takes PriorityPolicy policies
+        sim_time: total time units to simulate
+        util_threshold: threshold for adaptive switching, compared with the
+            utilization per core
+        heuristic: bin-packing heuristic for partitioned scheduling,
+            "first-fit", "best-fit" or "worst-fit"
+
+    Returns:
+        schedules: list with one Schedule per core
+        total_misses: dict of task_name -> missed deadlines count
+        core_util: simulated utilization of every core in %
+        migrations: number of times a preempted job resumed on another core
+        U: theoretical utilization sum ΣC_i / T_i
+        used_algo: final algorithm used on every core
+    """
+    if m < 1:
+        raise ValueError("The number of cores must be at least 1.")
+    if scheme == "global":
+        return _simulate_global(tasks, m, mode, sim_time, util_threshold)
+    if scheme == "partitioned":
+        return _simulate_partitioned(tasks, m, mode, sim_time, util_threshold, heuristic)
+    raise ValueError(f"Unknown multiprocessor scheme: {scheme}")
@@ -0,0 +1,325 @@
+"""
+Pluggable scheduling policies.
+
+A policy decides which job runs. The engine in this module releases jobs
+and detects deadline misses with the scheduler's JobReleases, advances time
+from event to event like the scheduler's event engine, and calls the
+policy's hooks:
+
+    - reset(tasks): a new simulation of the TaskSet starts
+    - on_release(job, now): a job was released
+    - pick_next(now): return the job to run from now on, or None to idle
+    - next_decision(job, now): latest time the engine may let job run
+      before asking pick_next again (None: only at the next release or
+      completion)
+    - on_tick(job, start, end): job ran in [start, end) (None: the CPU
+      was idle)
+    - on_complete(job, now): a job left the system, because it finished
+      or because the next job of its task replaced it (job.remaining > 0)
+
+New policies subclass Policy and are passed to simulate_scheduler as mode,
+either as an instance or by the name they were registered under with
+register_policy. RMS, DM, EDF, LLF (least laxity first), FIFO and RR
+(round robin) are built in.
+"""
+
+from collections import deque
+
+from scheduler import JobReleases, ReadyQueue, Schedule, compute_utilization
+from taskset import as_task_set
+
+
+class Job:
+    """
+    One job of a task.
+
+    Attributes:
+        task: index of the task in the TaskSet
+        name: task name
+        release: release time
+        abs_deadline: absolute deadline
+        remaining: execution time still needed
+        period, deadline: period and relative deadline of the task
+    """
+
+    __slots__ = ("task", "name", "release", "abs_deadline", "remaining",
+                 "period", "deadline")
+
+    def __init__(self, task, name, release, abs_deadline, remaining, period, deadline):
+        self.task = task
+        self.name = name
+        self.release = release
+        self.abs_deadline = abs_deadline
+        self.remaining = remaining
+        self.period = period
+        self.deadline = deadline
+
+
+class Policy:
+    """
+    Base class of scheduling policies. Every hook does nothing by default;
+    a policy must at least keep track of released jobs and implement
+    pick_next.
+    """
+
+    name = "Policy"
+
+    def reset(self, tasks):
+        pass
+
+    def on_release(self, job, now):
+        pass
+
+    def pick_next(self, now):
+        raise NotImplementedError
+
+    def next_decision(self, job, now):
+        return None
+
+    def on_tick(self, job, start, end):
+        pass
+
+    def on_complete(self, job, now):
+        pass
+
+
+class PriorityPolicy(Policy):
+    """
+    Preemptive policy that runs the ready job with the smallest key(job).
+    Priorities must not change while jobs wait. Ties go to task order.
+    """
+
+    def key(self, job):
+        raise NotImplementedError
+
+    def reset(self, tasks):
+        self._ready = ReadyQueue()
+
+    def on_release(self, job, now):
+        self._ready.push(job, (self.key(job), job.task))
+
+    def pick_next(self, now):
+        return self._ready.peek() if self._ready else None
+
+    def on_complete(self, job, now):
+        if job in self._ready:
+            self._ready.remove(job)
+
+
+class RMS(PriorityPolicy):
+    """Rate monotonic: shortest period first."""
+
+    name = "RMS"
+
+    def key(self, job):
+        return job.period
+
+
+class DM(PriorityPolicy):
+    """Deadline monotonic: shortest relative deadline first."""
+
+    name = "DM"
+
+    def key(self, job):
+        return job.deadline
+
+
+class EDF(PriorityPolicy):
+    """Earliest (absolute) deadline first."""
+
+    name = "EDF"
+
+    def key(self, job):
+        return job.abs_deadline
+
+
+class FIFO(PriorityPolicy):
+    """First in, first out: jobs run in release order, without preemption."""
+
+    name = "FIFO"
+
+    def key(self, job):
+        return job.release
+
+
+class LLF(Policy):
+    """
+    Least laxity first. The laxity of a job is its absolute deadline minus
+    the current time minus its remaining execution time; it shrinks while
+    the job waits, so the engine is asked to stop when a waiting job's
+    laxity drops below that of the running job. Ties go to task order.
+    """
+
+    name = "LLF"
+
+    def reset(self, tasks):
+        self._ready = set()
+
+    def on_release(self, job, now):
+        self._ready.add(job)
+
+    def on_complete(self, job, now):
+        self._ready.discard(job)
+
+    def _key(self, job, now):
+        return (job.abs_deadline - now - job.remaining, job.task)
+
+    def pick_next(self, now):
+        if not self._ready:
+            return None
+        return min(self._ready, key=lambda job: self._key(job, now))
+
+    def next_decision(self, job, now):
+        laxity = job.abs_deadline - now - job.remaining  # constant while it runs
+        decision = None
+        for other in self._ready:
+            if other is job:
+                continue
+            # First time t at which other's key drops below the running job's
+            t = other.abs_deadline - other.remaining - laxity
+            if other.task > job.task:
+                t += 1
+            if decision is None or t < decision:
+                decision = t
+        return decision
+
+
+class RR(Policy):
+    """
+    Round robin: ready jobs take turns in release order, each running for
+    at most quantum time units before it goes to the back of the queue.
+    """
+
+    name = "RR"
+
+    def __init__(self, quantum=1):
+        if quantum <= 0:
+            raise ValueError("The round robin quantum must be positive.")
+        self.quantum = quantum
+
+    def reset(self, tasks):
+        self._queue = deque()
+        self._used = 0  # time the job at the front has used of its quantum
+
+    def on_release(self, job, now):
+        self._queue.append(job)
+
+    def on_complete(self, job, now):
+        if self._queue and self._queue[0] is job:
+            self._queue.popleft()
+            self._used = 0
+        elif job in self._queue:
+            self._queue.remove(job)
+
+    def pick_next(self, now):
+        if not self._queue:
+            return None
+        if self._used >= self.quantum:
+            self._queue.rotate(-1)
+            self._used = 0
+        return self._queue[0]
+
+    def next_decision(self, job, now):
+        return now + self.quantum - self._used
+
+    def on_tick(self, job, start, end):
+        if job is not None:
+            self._used += end - start
+
+
+POLICIES = {policy.name: policy for policy in (RMS, DM, EDF, LLF, FIFO, RR)}
+
+
+def register_policy(name, factory):
+    """
+    Make a policy available to simulate_scheduler under a mode name.
+    factory is called without arguments for every simulation, e.g. a Policy
+    subclass.
+    """
+    POLICIES[name] = factory
+
+
+def get_policy(mode):
+    """
+    Return a Policy instance for a registered name or a Policy instance.
+    """
+    if isinstance(mode, Policy):
+        return mode
+    if mode not in POLICIES:
+        raise ValueError(f"Unknown scheduling policy: {mode}")
+    return POLICIES[mode]()
+
+
+def simulate_policy(tasks, policy, sim_time=50):
+    """
+    Simulate the task set under a pluggable policy.
+
+    Parameters:
+        tasks: TaskSet, or list of dicts with keys:
+            Name, Execution Time, Period, Deadline
+        policy: Policy instance or registered policy name
+        sim_time: total time units to simulate
+
+    Returns the same values as simulate_scheduler; used_algo is the
+    registered name the policy was given by, or the name of the Policy
+    instance.
+    """
+    name = policy if isinstance(policy, str) else policy.name
+    policy = get_policy(policy)
+    U = compute_utilization(tasks)
+    ts = as_task_set(tasks)
+    if (ts.T <= 0).any():
+        raise ValueError("Task periods must be positive.")
+
+    n = len(ts)
+    names = ts.names
+    releases = JobReleases(ts)
+    remaining = releases.remaining
+    jobs = [None] * n  # current job of every task
+
+    schedule = Schedule()
+    total_idle = 0
+    now = 0
+    policy.reset(ts)
+
+    while now < sim_time:
+        # Release every job that is due at the current time
+        for i, _ in releases.due(now):
+            old = jobs[i]
+            if old is not None and old.remaining > 0:
+                # The unfinished job is replaced by the new one
+                policy.on_complete(old, now)
+            job = Job(i, names[i], now, releases.abs_deadline[i], remaining[i],
+                      releases.T[i], releases.D[i])
+            jobs[i] = job
+            if job.remaining > 0:
+                policy.on_release(job, now)
+
+        next_event = min(releases.next_time(sim_time), sim_time)
+
+        job = policy.pick_next(now)
+        if job is None:
+            schedule.append("IDLE", now, next_event)
+            policy.on_tick(None, now, next_event)
+            total_idle += next_event - now
+            now = next_event
+            continue
+
+        # Run until completion, the next release or the policy's next decision
+        end = min(now + job.remaining, next_event)
+        decision = policy.next_decision(job, now)
+        if decision is not None:
+            end = min(end, max(decision, now + 1))
+        schedule.append(job.name, now, end)
+        job.remaining -= end - now
+        remaining[job.task] = job.remaining  # misses are detected from this list
+        policy.on_tick(job, now, end)
+        now = end
+        if job.remaining == 0:
+            policy.on_complete(job, now)
+
+    releases.save(ts)
+    total_misses = dict(zip(names, releases.misses))
+    util_percent = 100.0 * (1 - total_idle / sim_time)
+
+    return schedule, total_misses, util_percent, U, name
@@ -0,0 +1,245 @@
+"""
+Limited-preemption scheduling.
+
+simulate_scheduler lets a higher-priority job preempt the running job at any
+time. This module simulates the same RMS / EDF / Adaptive policies with less
+preemption, and counts how often jobs are preempted:
+
+    - "full": fully preemptive, the same schedule as simulate_scheduler
+    - "non-preemptive": a job that has started runs to completion
+    - "threshold": preemption thresholds. A running task can only be
+      preempted by a job whose preemption level is below the running task's
+      threshold. The level of a task is its period under RMS and its
+      relative deadline under EDF, so a lower level means a higher priority.
+    - "limited": floating non-preemptive regions. When a higher-priority job
+      arrives, the running job keeps the CPU for up to npr more time units
+      (or until it completes) before it is preempted.
+
+Switching tasks can also be given a cost. Every time the CPU switches to a
+different task, switch_cost time units of overhead run before the task does,
+and a preempted job pays its cache-related preemption delay (CRPD) on top
+when it resumes. Overhead runs without interruption and shows up as
+"OVERHEAD" in the schedule.
+"""
+
+from scheduler import (JobReleases, ReadyQueue, Schedule, _check_builtin_mode, _initial_algo,
+                       compute_utilization)
+from taskset import as_task_set
+
+PREEMPTION_MODES = ["full", "non-preemptive", "threshold", "limited"]
+OVERHEAD = "OVERHEAD"  # task name of switching overhead in the schedule
+
+
+def _per_task(values, names, default):
+    """
+    Expand a dict of task_name -> value (or one value for all tasks) into a
+    list in task order.
+    """
+    if values is None:
+        return list(default)
+    if isinstance(values, dict):
+        return [values.get(name, d) for name, d in zip(names, default)]
+    return [values] * len(names)
+
+
+def overhead_utilization(tasks, switch_cost=0, crpd=None):
+    """
+    Utilization under RMS with switching overhead included.
+
+    Every job pays one context switch, and it can be preempted at most once
+    per release of a task with a shorter period during its own period; each
+    such preemption costs another switch plus the job's CRPD.
+    """
+    ts = as_task_set(tasks)
+    names = ts.names
+    C = ts.C.tolist()
+    T = ts.T.tolist()
+    delay = _per_task(crpd, names, [0] * len(names))
+    total = 0.0
+    for i in range(len(names)):
+        if T[i] <= 0:
+            continue
+        preemptions = sum(-(-T[i] // T[j]) for j in range(len(names))
+                          if j != i and 0 < T[j] < T[i])
+        total += (C[i] + switch_cost + preemptions * (switch_cost + delay[i])) / T[i]
+    return total
+
+
+def simulate_preemptive(tasks, mode="RMS", preemption="full", sim_time=50,
+                        util_threshold=0.7, thresholds=None, npr=None,
+                        switch_cost=0, crpd=None):
+    """
+    Simulate scheduling with restricted preemption.
+
+    Parameters:
+        tasks: TaskSet, or list of dicts with keys:
+            Name, Execution Time, Period, Deadline
+        mode: "RMS", "EDF", or "Adaptive"
+        preemption: "full", "non-preemptive", "threshold" or "limited"
+        sim_time: total time units to simulate
+        util_threshold: threshold for adaptive switching
+        thresholds: for "threshold", dict of task_name -> preemption
+            threshold; tasks without one are fully preemptive
+        npr: for "limited", the longest non-preemptive region, as one value
+            for all tasks or a dict of task_name -> length (default 0)
+        switch_cost: overhead of every switch to a different task
+        crpd: extra overhead when a preempted job resumes, as one value for
+            all tasks or a dict of task_name -> delay (default 0)
+
+    Returns:
+        schedule: Schedule of (task_name, start, end) segments
+        total_misses: dict of task_name -> missed deadlines count
+        preemptions: dict of task_name -> number of times a started job of
+            the task was preempted
+        util_percent: simulated CPU utilization in %
+        U: theoretical utilization sum ΣC_i / T_i
+        used_algo: final algorithm used at the end of simulation
+        overhead: dict with the totals Switches, Preemptions and
+            Overhead Time
+
+    In Adaptive mode with switching costs, the starting algorithm is picked
+    by comparing overhead_utilization, not U, with util_threshold.
+    """
+    _check_builtin_mode(mode)
+    if preemption not in PREEMPTION_MODES:
+        raise ValueError(f"Unknown preemption mode: {preemption}")
+    U = compute_utilization(tasks)
+    if switch_cost or crpd:
+        current_algo = _initial_algo(
+            mode, overhead_utilization(tasks, switch_cost, crpd), util_threshold
+        )
+    else:
+        current_algo = _initial_algo(mode, U, util_threshold)
+    ts = as_task_set(tasks)
+    if (ts.T <= 0).any():
+        raise ValueError("Task periods must be positive.")
+
+    n = len(ts)
+    names = ts.names
+    releases = JobReleases(ts)
+    T = releases.T
+    D = releases.D
+    remaining = releases.remaining
+    abs_deadline = releases.abs_deadline
+    preempted = [0] * n
+
+    def level(i):
+        return T[i] if current_algo == "RMS" else D[i]
+
+    def key(i):
+        return (T[i] if current_algo == "RMS" else abs_deadline[i], i)
+
+    threshold = [None] * n
+    if preemption == "threshold":
+        threshold = _per_task(thresholds, names, [None] * n)
+    region = _per_task(npr, names, [0] * n)
+    delay = _per_task(crpd, names, [0] * n)
+    resumed = [False] * n  # current job was preempted and has not run since
+
+    ready = ReadyQueue()
+    schedule = Schedule()
+
+    running = None  # task whose started (executed) job holds the CPU
+    region_end = None  # end of the running job's non-preemptive region
+    last = None  # task that last had the CPU, None after idle time
+    switches = 0
+    overhead_time = 0
+    recent_misses = 0
+    total_idle = 0
+    now = 0
+
+    while now < sim_time:
+        # Release every job that is due at the current time
+        # (releases can fall inside an overhead segment and are handled late)
+        for i, missed in releases.due(now):
+            if missed:
+                recent_misses += 1
+            resumed[i] = False
+            if running == i:
+                # The unfinished job is replaced by the new one
+                running = None
+                region_end = None
+            if remaining[i] > 0:
+                ready.push(i, key(i))
+            elif i in ready:
+                ready.remove(i)
+
+        # Adaptive switching based on recent misses
+        if mode == "Adaptive" and recent_misses >= 3 and current_algo != "EDF":
+            current_algo = "EDF"
+            for i in ready.tasks():
+                ready.update(i, key(i))
+
+        next_event = min(releases.next_time(sim_time), sim_time)
+
+        if not ready:
+            schedule.append("IDLE", now, next_event)
+            total_idle += next_event - now
+            now = next_event
+            last = None
+            continue
+
+        # Decide whether the highest-priority job may take the CPU
+        chosen = ready.peek()
+        if chosen == running:
+            # Nothing outranks the running job (any more), so no region is open
+            region_end = None
+        elif running is not None:
+            if preemption == "non-preemptive":
+                chosen = running
+            elif preemption == "threshold":
+                limit = threshold[running]
+                if limit is not None:
+                    allowed = [j for j in ready.tasks()
+                               if key(j) < key(running) and level(j) < limit]
+                    chosen = min(allowed, key=key) if allowed else running
+            elif preemption == "limited":
+                if region_end is None:
+                    region_end = now + region[running]
+                if now < region_end:
+                    chosen = running
+        if chosen != running:
+            if running is not None:
+                preempted[running] += 1
+                resumed[running] = True
+                running = None
+            region_end = None
+
+        # Pay for switching to a different task before it runs
+        # (the job only counts as started once it has executed, so a job
+        # displaced during its own overhead is not preempted)
+        if chosen != last:
+            switches += 1
+            last = chosen
+            cost = switch_cost + (delay[chosen] if resumed[chosen] else 0)
+            if cost > 0:
+                end = min(now + cost, sim_time)
+                schedule.append(OVERHEAD, now, end)
+                overhead_time += end - now
+                now = end
+                continue
+
+        # Run until the job completes, the next release or the region ends
+        end = min(now + remaining[chosen], next_event)
+        if region_end is not None and region_end > now:
+            end = min(end, region_end)
+        running = chosen
+        resumed[chosen] = False
+        schedule.append(names[chosen], now, end)
+        remaining[chosen] -= end - now
+        now = end
+        if remaining[chosen] == 0:
+            ready.remove(chosen)
+            running = None
+            region_end = None
+
+    total_misses = dict(zip(names, releases.misses))
+    preemptions = dict(zip(names, preempted))
+    util_percent = 100.0 * (1 - total_idle / sim_time)
+    overhead = {
+        "Switches": switches,
+        "Preemptions": sum(preempted),
+        "Overhead Time": overhead_time,
+    }
+
+    return schedule, total_misses, preemptions, util_percent, U, current_algo, overhead
@@ -0,0 +1,828 @@
+"""
+Scheduling engine for the Adaptive OS Scheduler.
+
+This module holds the simulation logic used by the Streamlit app. It does not
+import Streamlit, so it can also be used from plain Python scripts.
+"""
+
+import bisect
+import heapq
+import math
+from collections import deque
+
+import compiled
+from taskset import TaskSet, as_task_set
+
+# -------------------- Helper Functions --------------------
+
+
+def compute_utilization(tasks):
+    """
+    Compute total utilization of the task set as sum(C_i / T_i).
+    """
+    if isinstance(tasks, TaskSet):
+        return tasks.utilization()
+    total = 0.0
+    for t in tasks:
+        C = float(t["Execution Time"])
+        T = float(t["Period"])
+        if T > 0:
+            total += C / T
+    return total
+
+
+def hyperperiod(tasks):
+    """
+    Least common multiple of all task periods.
+    """
+    if isinstance(tasks, TaskSet):
+        periods = tasks.T.tolist()
+    else:
+        periods = [int(t["Period"]) for t in tasks]
+    return math.lcm(*periods) if periods else 1
+
+
+def _initial_algo(mode, U, util_threshold):
+    """
+    Pick the algorithm the simulation starts with.
+    """
+    if mode == "Adaptive":
+        if U <= util_threshold:
+            return "RMS"
+        return "EDF"
+    return mode
+
+
+def _init_state(tasks):
+    """
+    Build the per-task runtime state used by the tick engine.
+    """
+    if isinstance(tasks, TaskSet):
+        tasks = tasks.to_records()
+    state = {}
+    for t in tasks:
+        name = t["Name"]
+        C = int(t["Execution Time"])
+        T = int(t["Period"])
+        D = int(t["Deadline"])
+        state[name] = {
+            "C": C,
+            "T": T,
+            "D": D,
+            "next_release": 0,
+            "remaining": 0,
+            "abs_deadline": 0,
+            "misses": 0,
+        }
+    return state
+
+
+# -------------------- Ready Queue --------------------
+
+
+class ReadyQueue:
+    """
+    Indexed binary min-heap of ready tasks.
+
+    Each task is stored once with a priority key (period for RMS, absolute
+    deadline for EDF). The heap position of every task is tracked, so a key can
+    be changed or a task removed in O(log n) instead of rescanning all tasks.
+    """
+
+    def __init__(self):
+        self._heap = []  # list of (key, task)
+        self._pos = {}  # task -> index in self._heap
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __contains__(self, task):
+        return task in self._pos
+
+    def tasks(self):
+        """
+        Return the queued tasks in no particular order.
+        """
+        return list(self._pos)
+
+    def push(self, task, key):
+        """
+        Insert a task, or change its key if it is already queued.
+        """
+        if task in self._pos:
+            self.update(task, key)
+            return
+        self._heap.append((key, task))
+        self._pos[task] = len(self._heap) - 1
+        self._sift_up(len(self._heap) - 1)
+
+    def update(self, task, key):
+        """
+        Change the key of a queued task (decrease-key or increase-key).
+        """
+        i = self._pos[task]
+        old_key = self._heap[i][0]
+        self._heap[i] = (key, task)
+        if key < old_key:
+            self._sift_up(i)
+        else:
+            self._sift_down(i)
+
+    def peek(self):
+        """
+        Return the task with the smallest key without removing it.
+        """
+        return self._heap[0][1]
+
+    def pop(self):
+        """
+        Remove and return the task with the smallest key.
+        """
+        task = self._heap[0][1]
+        self.remove(task)
+        return task
+
+    def remove(self, task):
+        """
+        Remove a task from the queue.
+        """
+        i = self._pos.pop(task)
+        last = self._heap.pop()
+        if i < len(self._heap):
+            self._heap[i] = last
+            self._pos[last[1]] = i
+            self._sift_up(i)
+            self._sift_down(self._pos[last[1]])
+
+    def _sift_up(self, i):
+        heap = self._heap
+        item = heap[i]
+        while i > 0:
+            parent = (i - 1) // 2
+            if heap[parent][0] <= item[0]:
+                break
+            heap[i] = heap[parent]
+            self._pos[heap[i][1]] = i
+            i = parent
+        heap[i] = item
+        self._pos[item[1]] = i
+
+    def _sift_down(self, i):
+        heap = self._heap
+        n = len(heap)
+        item = heap[i]
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and heap[child + 1][0] < heap[child][0]:
+                child += 1
+            if item[0] <= heap[child][0]:
+                break
+            heap[i] = heap[child]
+            self._pos[heap[i][1]] = i
+            i = child
+        heap[i] = item
+        self._pos[item[1]] = i
+
+
+# -------------------- Job Releases --------------------
+
+
+class JobReleases:
+    """
+    Periodic job releases and deadline-miss detection, shared by the
+    event-driven simulation loops.
+
+    The runtime state of every task is kept in plain lists indexed by task:
+    remaining execution time and absolute deadline of its current job, next
+    release time and missed deadlines count. As in the tick engine, a job
+    that is still unfinished when the next job of its task is released is
+    replaced by it, and counts as a miss if that release comes after its
+    deadline. The loops decrease remaining as jobs run.
+
+    With jitter (a list of maximum extra delays per task) and a NumPy
+    random generator, the tasks are sporadic: each release comes the period
+    plus a random 0..jitter time units after the previous one.
+    """
+
+    def __init__(self, ts, jitter=None, rng=None):
+        n = len(ts)
+        self.C = ts.C.tolist()
+        self.T = ts.T.tolist()
+        self.D = ts.D.tolist()
+        self.remaining = [0] * n
+        self.abs_deadline = [0] * n
+        self.next_release = [0] * n
+        self.misses = [0] * n
+        self._jitter = jitter if jitter and any(jitter) else None
+        self._rng = rng
+        # Heap of pending releases as (release_time, task_index)
+        self.pending = [(0, i) for i in range(n)]
+
+    def next_time(self, default):
+        """
+        Time of the next release, or default when no task is pending.
+        """
+        return self.pending[0][0] if self.pending else default
+
+    def due(self, now):
+        """
+        Release every job due at or before now, in release order.
+
+        Returns a list of (task, missed) pairs, one per released job; missed
+        is True when the job it replaced missed its deadline. Releases
+        handled late (after an uninterruptible segment) keep their release
+        time.
+        """
+        heap = self.pending
+        if not heap or heap[0][0] > now:
+            return ()
+        remaining = self.remaining
+        abs_deadline = self.abs_deadline
+        released = []
+        while heap[0][0] <= now:
+            release, i = heap[0]
+            missed = remaining[i] > 0 and release > abs_deadline[i]
+            if missed:
+                self.misses[i] += 1
+            remaining[i] = self.C[i]
+            abs_deadline[i] = release + self.D[i]
+            next_release = release + self.T[i]
+            if self._jitter and self._jitter[i]:
+                next_release += int(self._rng.integers(0, self._jitter[i] + 1))
+            self.next_release[i] = next_release
+            # The task's next release takes the place of the one just handled
+            heapq.heapreplace(heap, (next_release, i))
+            released.append((i, missed))
+        return released
+
+    def save(self, ts):
+        """
+        Copy the counters into the TaskSet's runtime columns.
+        """
+        ts.remaining[:] = self.remaining
+        ts.abs_deadline[:] = self.abs_deadline
+        ts.next_release[:] = self.next_release
+        ts.misses[:] = self.misses
+
+
+# -------------------- Schedule --------------------
+
+
+class Schedule:
+    """
+    Run-length encoded schedule.
+
+    The schedule is stored as contiguous (task, start, end) segments, each
+    covering the time range [start, end). Consecutive segments of the same
+    task are merged. Iterating over the schedule or indexing it gives the
+    per-tick view of (time, task_name) tuples, computed on demand.
+
+    switches lists (time, algorithm) pairs: the algorithm in use from each
+    time on, starting at time 0. Simulations that switch algorithms fill it.
+    """
+
+    def __init__(self, segments=()):
+        self.segments = []
+        self._starts = []
+        self.switches = []
+        for task, start, end in segments:
+            self.append(task, start, end)
+
+    def append(self, task, start, end):
+        """
+        Add a segment, merging it with the previous one when possible.
+        """
+        if end <= start:
+            return
+        if self.segments:
+            last_task, last_start, last_end = self.segments[-1]
+            if start != last_end:
+                raise ValueError("Schedule segments must be contiguous.")
+            if last_task == task:
+                self.segments[-1] = (task, last_start, end)
+                return
+        self.segments.append((task, start, end))
+        self._starts.append(start)
+
+    def __len__(self):
+        if not self.segments:
+            return 0
+        return self.segments[-1][2] - self.segments[0][1]
+
+    def __iter__(self):
+        for task, start, end in self.segments:
+            for t in range(start, end):
+                yield (t, task)
+
+    def __getitem__(self, index):
+        n = len(self)
+        if isinstance(index, slice):
+            start, stop, step = index.indices(n)
+            if step == 1 and start < stop:
+                offset = self.segments[0][1]
+                return self.ticks(offset + start, offset + stop)
+            return [self[i] for i in range(start, stop, step)]
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("schedule index out of range")
+        time = self.segments[0][1] + index
+        return (time, self.task_at(time))
+
+    def count(self, task, start, stop):
+        """
+        Number of time units in [start, stop) during which the task ran.
+        """
+        total = 0
+        i = max(bisect.bisect_right(self._starts, start) - 1, 0)
+        for seg_task, seg_start, seg_end in self.segments[i:]:
+            if seg_start >= stop:
+                break
+            if seg_task == task:
+                total += max(0, min(seg_end, stop) - max(seg_start, start))
+        return total
+
+    def task_at(self, time):
+        """
+        Return the task running at the given time.
+        """
+        i = bisect.bisect_right(self._starts, time) - 1
+        if i < 0 or time >= self.segments[i][2]:
+            raise IndexError(f"time {time} is not covered by the schedule")
+        return self.segments[i][0]
+
+    def window(self, start=None, stop=None):
+        """
+        Return a new Schedule with the segments clipped to [start, stop).
+        """
+        if not self.segments:
+            return Schedule()
+        if start is None:
+            start = self.segments[0][1]
+        if stop is None:
+            stop = self.segments[-1][2]
+        i = max(bisect.bisect_right(self._starts, start) - 1, 0)
+        j = bisect.bisect_left(self._starts, stop)
+        segments = self.segments[i:j]
+        if segments:
+            task, seg_start, seg_end = segments[0]
+            segments[0] = (task, max(seg_start, start), seg_end)
+            task, seg_start, seg_end = segments[-1]
+            segments[-1] = (task, seg_start, min(seg_end, stop))
+            if segments[0][2] <= segments[0][1]:
+                segments = segments[1:]
+        clipped = Schedule()
+        clipped.segments = segments
+        clipped._starts = [seg_start for _, seg_start, _ in segments]
+        return clipped
+
+    def ticks(self, start=0, stop=None):
+        """
+        Expand the segments overlapping [start, stop) into (time, task) tuples.
+        """
+        if not self.segments:
+            return []
+        if stop is None:
+            stop = self.segments[-1][2]
+        rows = []
+        i = max(bisect.bisect_right(self._starts, start) - 1, 0)
+        for task, seg_start, seg_end in self.segments[i:]:
+            if seg_start >= stop:
+                break
+            for t in range(max(seg_start, start), min(seg_end, stop)):
+                rows.append((t, task))
+        return rows
+
+    def page(self, start=0, skip=0, limit=100, task=None):
+        """
+        One page of the per-tick view: up to limit (time, task) rows from
+        time start onwards, after skipping the first skip rows. With task
+        set, only that task's rows count. Only the returned rows are built,
+        so memory does not grow with the length of the schedule.
+        """
+        rows = []
+        if not self.segments:
+            return rows
+        i = max(bisect.bisect_right(self._starts, start) - 1, 0)
+        for j in range(i, len(self.segments)):
+            if len(rows) >= limit:
+                break
+            seg_task, seg_start, seg_end = self.segments[j]
+            if task is not None and seg_task != task:
+                continue
+            seg_start = max(seg_start, start)
+            length = max(0, seg_end - seg_start)
+            if skip >= length:
+                skip -= length
+                continue
+            first = seg_start + skip
+            skip = 0
+            stop = min(seg_end, first + limit - len(rows))
+            rows.extend((t, seg_task) for t in range(first, stop))
+        return rows
+
+
+# -------------------- Simulation Engines --------------------
+
+
+def _simulate_ticks(tasks, mode, sim_time, util_threshold):
+    """
+    Reference engine: step the simulation one time unit at a time.
+    """
+    U = compute_utilization(tasks)
+    current_algo = _initial_algo(mode, U, util_threshold)
+    state = _init_state(tasks)
+
+    schedule = Schedule()
+    schedule.switches.append((0, current_algo))
+    total_idle = 0
+    recent_misses = 0  # used for adaptive switching
+
+    for time in range(sim_time):
+        # Release jobs at the start of each time unit
+        for name, s in state.items():
+            if time >= s["next_release"]:
+                # If previous job is not finished and deadline passed -> miss
+                if s["remaining"] > 0 and time > s["abs_deadline"]:
+                    s["misses"] += 1
+                    recent_misses += 1
+                # Release new job
+                s["remaining"] = s["C"]
+                s["abs_deadline"] = time + s["D"]
+                s["next_release"] += s["T"]
+
+        # Collect ready tasks
+        ready = [name for name, s in state.items() if s["remaining"] > 0]
+
+        # Adaptive switching based on recent misses
+        if mode == "Adaptive":
+            # If too many misses recently, switch to EDF
+            if recent_misses >= 3:
+                if current_algo != "EDF":
+                    schedule.switches.append((time, "EDF"))
+                current_algo = "EDF"
+
+        # If no task is ready, CPU is idle
+        if not ready:
+            schedule.append("IDLE", time, time + 1)
+            total_idle += 1
+        else:
+            # Choose task according to current algorithm
+            if current_algo == "RMS":
+                # Choose task with smallest period
+                chosen = min(ready, key=lambda n: state[n]["T"])
+            else:  # EDF
+                # Choose task with earliest absolute deadline
+                chosen = min(ready, key=lambda n: state[n]["abs_deadline"])
+
+            schedule.append(chosen, time, time + 1)
+            state[chosen]["remaining"] -= 1
+
+    # Collect statistics
+    total_misses = {name: s["misses"] for name, s in state.items()}
+    util_percent = 100.0 * (1 - total_idle / sim_time)
+
+    return schedule, total_misses, util_percent, U, current_algo
+
+
+def _event_stream(ts, U, mode, sim_time, util_threshold, steady_state=False,
+                  miss_window=None, miss_high=3, miss_low=0):
+    """
+    Discrete-event engine: jump directly between job releases and completions.
+
+    Priorities only change when a job is released, so between two releases the
+    chosen task keeps the CPU until it completes or the next release arrives.
+    Deadline misses are detected when the next job of a task is released, exactly
+    as in the tick engine, so no separate deadline events are needed.
+
+    Yields the events described in iter_schedule. sim_time=None runs forever.
+
+    With steady_state=True the state is recorded at every multiple of the
+    hyperperiod. As soon as a state repeats, the schedule is periodic from
+    there on: a ("steady", start, time) event is yielded, where [start, time)
+    is the repeating cycle, and the stream ends.
+
+    Adaptive mode switches to EDF once miss_high misses have been counted.
+    Without miss_window every miss counts and the switch is permanent. With
+    it, only misses in the last miss_window time units count, and a run that
+    started with RMS goes back to RMS once that count drops to miss_low.
+    """
+    current_algo = _initial_algo(mode, U, util_threshold)
+    # Only a switch made because of misses is undone when they stop
+    can_return = miss_window is not None and current_algo == "RMS"
+    if (ts.T <= 0).any():
+        raise ValueError("Task periods must be positive.")
+
+    # The hot loop works on plain lists taken from the TaskSet columns
+    n = len(ts)
+    names = ts.names
+    releases = JobReleases(ts)
+    T = releases.T
+    remaining = releases.remaining
+    abs_deadline = releases.abs_deadline
+    # Read directly in the hot loop to skip the call when nothing is due
+    pending = releases.pending
+
+    # Ready-queue key: period for RMS, absolute deadline for EDF
+    key = T if current_algo == "RMS" else abs_deadline
+    ready = ReadyQueue()
+
+    recent_misses = 0  # used for adaptive switching
+    window = deque()  # miss times within miss_window, oldest first
+    now = 0
+    end = float("inf") if sim_time is None else sim_time
+
+    if steady_state:
+        H = hyperperiod(ts)
+        seen = {}  # state at a hyperperiod boundary -> time
+
+    try:
+        yield ("algo", current_algo, 0)
+
+        while now < end:
+            if steady_state and now % H == 0:
+                # All tasks release at multiples of H, so the state there is the
+                # backlog of each task plus the adaptive policy state
+                if miss_window is None:
+                    misses_state = recent_misses if current_algo == "RMS" else 0
+                else:
+                    while window and window[0] <= now - miss_window:
+                        window.popleft()
+                    misses_state = tuple(now - t for t in window)
+                snapshot = (
+                    current_algo,
+                    misses_state if mode == "Adaptive" else 0,
+                    tuple(remaining),
+                    tuple(abs_deadline[i] - now if remaining[i] > 0 else 0 for i in range(n)),
+                )
+                if snapshot in seen:
+                    yield ("steady", seen[snapshot], now)
+                    return
+                seen[snapshot] = now
+
+            # Release every job that is due at the current time
+            if pending and pending[0][0] <= now:
+                for i, missed in releases.due(now):
+                    if missed:
+                        recent_misses += 1
+                        if miss_window is not None:
+                            window.append(now)
+                        yield ("miss", names[i], now)
+                    if remaining[i] > 0:
+                        ready.push(i, (key[i], i))
+                    elif i in ready:
+                        ready.remove(i)
+
+            # Adaptive switching based on recent misses
+            if mode == "Adaptive":
+                if miss_window is not None:
+                    while window and window[0] <= now - miss_window:
+                        window.popleft()
+                    recent_misses = len(window)
+                algo = current_algo
+                if current_algo == "RMS" and recent_misses >= miss_high:
+                    algo = "EDF"
+                elif can_return and current_algo == "EDF" and recent_misses <= miss_low:
+                    algo = "RMS"
+                if algo != current_algo:
+                    current_algo = algo
+                    key = T if current_algo == "RMS" else abs_deadline
+                    for i in ready.tasks():
+                        ready.update(i, (key[i], i))
+                    yield ("algo", current_algo, now)
+
+            next_event = min(pending[0][0], end) if pending else end
+            if can_return and current_algo == "EDF" and window:
+                # Stop when the oldest miss leaves the window, it may switch back
+                next_event = min(next_event, window[0] + miss_window)
+
+            if not ready:
+                yield ("segment", "IDLE", now, next_event)
+                now = next_event
+                continue
+
+            # Run the chosen job until it completes or the next release arrives
+            chosen = ready.peek()
+            run = min(remaining[chosen], next_event - now)
+            yield ("segment", names[chosen], now, now + run)
+            remaining[chosen] -= run
+            if remaining[chosen] == 0:
+                ready.pop()
+            now += run
+    finally:
+        # Leave the counters of the point the simulation stopped at in the TaskSet
+        releases.save(ts)
+
+
+def iter_schedule(tasks, mode="Adaptive", sim_time=None, util_threshold=0.7,
+                  steady_state=False, miss_window=None, miss_high=3, miss_low=0):
+    """
+    Run the event engine lazily and yield events as they happen.
+
+    Parameters:
+        tasks: TaskSet, or list of dicts with keys:
+            Name, Execution Time, Period, Deadline
+        mode: "RMS", "EDF", or "Adaptive"
+        sim_time: total time units to simulate, or None to run until the
+            caller stops iterating
+        util_threshold: threshold for adaptive switching
+        steady_state: end the stream once the schedule starts repeating
+        miss_window, miss_high, miss_low: adaptive switching, see
+            simulate_scheduler
+
+    Yields tuples whose first item is the event kind:
+        ("algo", algorithm, time): algorithm in use from time on; the first
+            event gives the starting algorithm
+        ("miss", task_name, time): a job of the task missed its deadline
+        ("segment", task_name, start, end): the task (or "IDLE") ran in
+            [start, end); consecutive segments may belong to the same task
+        ("steady", start, time): only with steady_state; the schedule in
+            [start, time) repeats forever
+
+    Nothing is accumulated, so memory use does not grow with the horizon.
+    """
+    _check_builtin_mode(mode)
+    _check_switching(miss_window, miss_high, miss_low)
+    ts = as_task_set(tasks)
+    return _event_stream(ts, compute_utilization(tasks), mode, sim_time,
+                         util_threshold, steady_state, miss_window, miss_high, miss_low)
+
+
+def _check_builtin_mode(mode):
+    """
+    Reject modes other than RMS, EDF and Adaptive (e.g. pluggable policies)
+    in simulations that only implement those three.
+    """
+    if not (isinstance(mode, str) and mode in BUILTIN_MODES):
+        raise ValueError(f"Only RMS, EDF and Adaptive are supported here, not {mode!r}.")
+
+
+def _check_switching(miss_window, miss_high, miss_low):
+    if miss_window is not None and miss_window <= 0:
+        raise ValueError("The miss window must be positive.")
+    if not 0 <= miss_low < miss_high:
+        raise ValueError("Adaptive switching needs 0 <= miss_low < miss_high.")
+
+
+def _simulate_events(tasks, mode, sim_time, util_threshold, steady_state=False,
+                     miss_window=None, miss_high=3, miss_low=0):
+    """
+    Collect the event stream into the results of simulate_scheduler.
+
+    With steady_state the repeating cycle reported by the stream is used to
+    extrapolate misses and idle time to sim_time.
+    """
+    U = compute_utilization(tasks)
+    ts = as_task_set(tasks)
+
+    schedule = Schedule()
+    misses = dict.fromkeys(ts.names, 0)
+    miss_log = []  # (time, task_name) of every miss, for extrapolation
+    total_idle = 0
+    current_algo = None
+
+    stream = _event_stream(ts, U, mode, sim_time, util_threshold, steady_state,
+                           miss_window, miss_high, miss_low)
+    for event in stream:
+        kind = event[0]
+        if kind == "segment":
+            _, name, start, end = event
+            schedule.append(name, start, end)
+            if name == "IDLE":
+                total_idle += end - start
+        elif kind == "miss":
+            misses[event[1]] += 1
+            if steady_state:
+                miss_log.append((event[2], event[1]))
+        elif kind == "algo":
+            current_algo = event[1]
+            schedule.switches.append((event[2], current_algo))
+        else:  # steady
+            _, start, now = event
+            cycle = now - start
+            q, r = divmod(sim_time - now, cycle)
+            # Whole cycles repeat the misses and idle time of the cycle, and the
+            # last partial cycle replays the first r time units of it
+            for t, name in miss_log:
+                if start <= t < now:
+                    misses[name] += q
+                if start <= t < start + r:
+                    misses[name] += 1
+            total_idle += q * schedule.count("IDLE", start, now)
+            total_idle += schedule.count("IDLE", start, start + r)
+            # The horizon ends at the same point of the cycle as start + r
+            stop = start + (r or cycle)
+            current_algo = [algo for t, algo in schedule.switches if t < stop][-1]
+
+    # With steady_state the TaskSet counters other than misses describe the
+    # time the simulation stopped at, not the end of the horizon
+    ts.misses[:] = list(misses.values())
+
+    util_percent = 100.0 * (1 - total_idle / sim_time)
+
+    return schedule, misses, util_percent, U, current_algo
+
+
+def _simulate_compiled(tasks, mode, sim_time, util_threshold):
+    """
+    Tick engine compiled with Numba. Without Numba the pure-Python tick
+    engine runs instead, with identical results.
+    """
+    if not compiled.AVAILABLE:
+        return _simulate_ticks(tasks, mode, sim_time, util_threshold)
+    U = compute_utilization(tasks)
+    current_algo = _initial_algo(mode, U, util_threshold)
+    ts = as_task_set(tasks)
+    mode_code = {"RMS": compiled.RMS, "EDF": compiled.EDF}.get(mode, compiled.ADAPTIVE)
+
+    seg_task, seg_start, seg_end, misses, total_idle, switch_time = compiled.tick_loop(
+        ts.C, ts.T, ts.D, mode_code, current_algo == "RMS", sim_time
+    )
+    switches = [(0, current_algo)]
+    if switch_time >= 0:
+        current_algo = "EDF"
+        switches.append((int(switch_time), current_algo))
+
+    labels = ts.names + ["IDLE"]  # task -1 is IDLE
+    schedule = Schedule()
+    schedule.segments = [
+        (labels[i], start, end)
+        for i, start, end in zip(seg_task.tolist(), seg_start.tolist(), seg_end.tolist())
+    ]
+    schedule._starts = seg_start.tolist()
+    schedule.switches = switches
+    total_misses = dict(zip(ts.names, misses.tolist()))
+    util_percent = 100.0 * (1 - int(total_idle) / sim_time)
+
+    return schedule, total_misses, util_percent, U, current_algo
+
+
+BUILTIN_MODES = ["RMS", "EDF", "Adaptive"]
+
+_ENGINES = {
+    "event": _simulate_events,
+    "tick": _simulate_ticks,
+    "compiled": _simulate_compiled,
+}
+
+
+def simulate_scheduler(tasks, mode="Adaptive", sim_time=50, util_threshold=0.7,
+                       engine="event", steady_state=False, miss_window=None,
+                       miss_high=3, miss_low=0):
+    """
+    Simulate real-time scheduling for the given task set.
+
+    Parameters:
+        tasks: TaskSet, or list of dicts with keys:
+            Name, Execution Time, Period, Deadline
+        mode: "RMS", "EDF", or "Adaptive"; any other policy registered in
+            policies.py (e.g. "DM", "LLF", "FIFO", "RR"), or a
+            policies.Policy instance, runs on the pluggable policy engine,
+            which only takes the default values of the other options
+        sim_time: total time units to simulate
+        util_threshold: threshold for adaptive switching
+        engine: "event" (default) jumps between release and completion
+            events; "tick" steps one time unit at a time and is kept as a
+            reference implementation; "compiled" is the tick engine compiled
+            with Numba when it is installed
+        steady_state: stop once the state at a hyperperiod boundary repeats
+            and extrapolate misses and utilization to sim_time. Only
+            supported by the event engine. The returned schedule then only
+            covers the simulated part of the horizon.
+        miss_window: Adaptive mode only. By default the scheduler switches
+            to EDF for good after miss_high deadline misses. With a window
+            (in time units), only misses in the last miss_window units
+            count, and a run that started with RMS switches back to RMS
+            once they drop to miss_low. Only supported by the event engine.
+        miss_high, miss_low: hysteresis thresholds of adaptive switching
+
+    Returns:
+        schedule: Schedule of (task_name, start, end) segments; iterate
+            over it for the per-tick (time, task_name) view
+        total_misses: dict of task_name -> missed deadlines count
+        util_percent: simulated CPU utilization in %
+        U: theoretical utilization sum ΣC_i / T_i
+        used_algo: final algorithm used at the end of simulation
+
+    The algorithm switches of Adaptive mode are recorded in
+    schedule.switches.
+    """
+    if engine not in _ENGINES:
+        raise ValueError(f"Unknown simulation engine: {engine}")
+    _check_switching(miss_window, miss_high, miss_low)
+    if not (isinstance(mode, str) and mode in BUILTIN_MODES):
+        if (engine != "event" or steady_state or miss_window is not None or miss_high != 3
+                or miss_low != 0 or util_threshold != 0.7):
+            raise ValueError("Pluggable policies only support the default simulation options.")
+        # Imported here because policies builds on this module
+        from policies import simulate_policy
+        return simulate_policy(tasks, mode, sim_time)
+    if steady_state or miss_window is not None or miss_high != 3:
+        if engine != "event":
+            raise ValueError("steady_state and adaptive switching options are only "
+                             "supported by the event engine.")
+        return _simulate_events(tasks, mode, sim_time, util_threshold, steady_state,
+                                miss_window, miss_high, miss_low)
+    return _ENGINES[engine](tasks, mode, sim_time, util_threshold)
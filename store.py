@@ -0,0 +1,184 @@
+"""
+Persistent on-disk store for simulation results.
+
+Results of simulate_scheduler are kept in a SQLite database, keyed by a hash
+of the normalized task set and simulation parameters. The database survives
+server restarts and can be shared by several processes (Streamlit workers,
+sweep workers). When it grows beyond its size limit, the least recently used
+results are evicted.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import zlib
+
+from scheduler import Schedule, simulate_scheduler
+from taskset import as_task_set
+
+# Bump when simulation semantics change, so old results are not reused
+STORE_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    segments BLOB NOT NULL,
+    misses TEXT NOT NULL,
+    util_percent REAL NOT NULL,
+    utilization REAL NOT NULL,
+    used_algo TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_access REAL NOT NULL
+)
+"""
+
+
+def _mode_key(mode):
+    """
+    JSON form of a mode: its name, or for a policies.Policy instance its
+    class, name and public attributes (its parameters, e.g. the RR quantum).
+    """
+    if isinstance(mode, str):
+        return mode
+    params = {name: value for name, value in vars(mode).items() if not name.startswith("_")}
+    return [f"{type(mode).__module__}.{type(mode).__qualname__}", mode.name, params]
+
+
+def result_key(tasks, mode, sim_time, util_threshold, steady_state=False,
+               miss_window=None, miss_high=3, miss_low=0):
+    """
+    Content hash of a simulation's inputs. Parameters that cannot change the
+    result (the threshold outside Adaptive mode) are left out. Policy
+    instances are keyed by their parameters, which must be JSON
+    serializable.
+    """
+    ts = as_task_set(tasks)
+    payload = {
+        "version": STORE_VERSION,
+        "tasks": list(zip(ts.names, ts.C.tolist(), ts.T.tolist(), ts.D.tolist())),
+        "mode": _mode_key(mode),
+        "sim_time": int(sim_time),
+        "util_threshold": float(util_threshold) if mode == "Adaptive" else None,
+        "steady_state": bool(steady_state),
+        "switching": [miss_window, miss_high, miss_low] if mode == "Adaptive" else None,
+    }
+    try:
+        encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    except TypeError as e:
+        raise ValueError(f"Cannot store results of this policy: {e}") from None
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+class ResultStore:
+    """
+    SQLite-backed, size-bounded LRU store of simulate_scheduler results.
+
+    A new connection is opened for every operation, so one store object can
+    be used from several threads, and several processes can use the same file.
+    """
+
+    def __init__(self, path, max_bytes=256 * 2**20):
+        self.path = path
+        self.max_bytes = max_bytes
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+
+    @contextlib.contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key):
+        """
+        Return the stored result tuple for key, or None.
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT segments, misses, util_percent, utilization, used_algo "
+                "FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE results SET last_access = ? WHERE key = ?", (time.time(), key)
+            )
+        segments, misses, util_percent, U, used_algo = row
+        stored = json.loads(zlib.decompress(segments))
+        schedule = Schedule(stored["segments"])
+        schedule.switches = [tuple(switch) for switch in stored["switches"]]
+        return schedule, json.loads(misses), util_percent, U, used_algo
+
+    def put(self, key, result):
+        """
+        Store a simulate_scheduler result tuple under key, then evict old
+        results if the store is over its size limit.
+        """
+        schedule, misses, util_percent, U, used_algo = result
+        segments = zlib.compress(json.dumps({
+            "segments": schedule.segments,
+            "switches": schedule.switches,
+        }).encode())
+        misses = json.dumps(misses)
+        size = len(segments) + len(misses)
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, segments, misses, util_percent, U, used_algo, size, time.time()),
+            )
+        self.evict()
+
+    def evict(self):
+        """
+        Delete least recently used results until the store fits in max_bytes.
+        """
+        with self._connect() as conn:
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            rows = conn.execute(
+                "SELECT key, size FROM results ORDER BY last_access"
+            ).fetchall()
+            doomed = []
+            for key, size in rows:
+                if total <= self.max_bytes:
+                    break
+                doomed.append((key,))
+                total -= size
+            conn.executemany("DELETE FROM results WHERE key = ?", doomed)
+
+    def __len__(self):
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM results")
+
+
+def cached_simulate(store, tasks, mode="Adaptive", sim_time=50, util_threshold=0.7,
+                    steady_state=False, miss_window=None, miss_high=3, miss_low=0):
+    """
+    simulate_scheduler that consults the store first and saves new results.
+    With store=None it simply simulates.
+    """
+    options = dict(mode=mode, sim_time=sim_time, util_threshold=util_threshold,
+                   steady_state=steady_state, miss_window=miss_window,
+                   miss_high=miss_high, miss_low=miss_low)
+    if store is None:
+        return simulate_scheduler(tasks, **options)
+    key = result_key(tasks, **options)
+    result = store.get(key)
+    if result is None:
+        result = simulate_scheduler(tasks, **options)
+        store.put(key, result)
+    return result
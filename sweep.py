@@ -0,0 +1,179 @@
+"""
+Parallel parameter sweeps over simulate_scheduler.
+
+A sweep runs every combination of task set, scheduling mode, adaptive
+threshold and simulation time in a process pool and collects one result row
+per run. Rows always come back in the order of the configurations, however
+the work was spread over the workers.
+
+Usage from a script:
+
+    from sweep import run_sweep
+    df = run_sweep(task_sets, modes=["RMS", "EDF"], util_thresholds=[0.6, 0.7])
+
+or from the command line:
+
+    python sweep.py tasks.csv --modes RMS EDF Adaptive --thresholds 0.6 0.7 --out results.csv
+"""
+
+import argparse
+import itertools
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from store import ResultStore, _mode_key, cached_simulate
+
+RESULT_COLUMNS = [
+    "Task Set", "Mode", "Util Threshold", "Sim Time",
+    "Utilization", "Simulated Utilization (%)", "Misses", "Algorithm",
+]
+
+
+def sweep_configs(task_sets, modes=("RMS", "EDF", "Adaptive"),
+                  util_thresholds=(0.7,), sim_times=(50,)):
+    """
+    List every (task_set_index, mode, util_threshold, sim_time) combination.
+    """
+    return list(itertools.product(
+        range(len(task_sets)), modes, util_thresholds, sim_times
+    ))
+
+
+def _mode_label(mode):
+    """
+    Mode column value: the mode name, or for a policies.Policy instance its
+    name and parameters, e.g. "RR(quantum=2)".
+    """
+    key = _mode_key(mode)
+    if isinstance(key, str):
+        return key
+    _, name, params = key
+    if not params:
+        return name
+    return f"{name}({', '.join(f'{k}={v!r}' for k, v in sorted(params.items()))})"
+
+
+def _run_chunk(task_sets, configs, store_path=None):
+    """
+    Simulate a chunk of configurations and return their result rows.
+    Runs inside a worker process.
+    """
+    store = ResultStore(store_path) if store_path else None
+    rows = []
+    for index, mode, util_threshold, sim_time in configs:
+        # The threshold only applies to Adaptive mode; pluggable policies
+        # reject any other value
+        _, misses, util_percent, U, used_algo = cached_simulate(
+            store, task_sets[index], mode=mode, sim_time=sim_time,
+            util_threshold=util_threshold if mode == "Adaptive" else 0.7
+        )
+        rows.append({
+            "Task Set": index,
+            "Mode": _mode_label(mode),
+            "Util Threshold": util_threshold,
+            "Sim Time": sim_time,
+            "Utilization": U,
+            "Simulated Utilization (%)": util_percent,
+            "Misses": sum(misses.values()),
+            "Algorithm": used_algo,
+        })
+    return rows
+
+
+def iter_sweep(task_sets, modes=("RMS", "EDF", "Adaptive"), util_thresholds=(0.7,),
+               sim_times=(50,), max_workers=None, chunk_size=None, store_path=None):
+    """
+    Run a sweep and yield result rows (dicts) in configuration order as soon
+    as they are available.
+
+    Parameters:
+        task_sets: list of TaskSet objects or lists of task dicts
+        modes: scheduling modes to run
+        util_thresholds: adaptive thresholds to run
+        sim_times: simulation horizons to run
+        max_workers: number of worker processes (default: CPU count);
+            1 runs everything in the current process
+        chunk_size: configurations sent to a worker at a time (default:
+            about four chunks per worker)
+        store_path: optional ResultStore database; stored results are
+            reused and new ones are saved
+    """
+    configs = sweep_configs(task_sets, modes, util_thresholds, sim_times)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, math.ceil(len(configs) / (4 * max_workers)))
+    chunks = [configs[i:i + chunk_size] for i in range(0, len(configs), chunk_size)]
+
+    if max_workers == 1:
+        for chunk in chunks:
+            yield from _run_chunk(task_sets, chunk, store_path)
+        return
+
+    # Each chunk only carries the task sets it needs
+    def payload(chunk):
+        needed = {index for index, _, _, _ in chunk}
+        return {index: task_sets[index] for index in needed}, chunk, store_path
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_run_chunk, *payload(chunk)) for chunk in chunks]
+        # Yield in submission order so results are deterministic
+        for future in futures:
+            yield from future.result()
+
+
+def run_sweep(task_sets, modes=("RMS", "EDF", "Adaptive"), util_thresholds=(0.7,),
+              sim_times=(50,), max_workers=None, chunk_size=None, store_path=None):
+    """
+    Run a sweep and collect all result rows into a single DataFrame.
+
+    See iter_sweep for the parameters.
+    """
+    rows = iter_sweep(task_sets, modes, util_thresholds, sim_times,
+                      max_workers, chunk_size, store_path)
+    return pd.DataFrame(list(rows), columns=RESULT_COLUMNS)
+
+
+# -------------------- Command Line --------------------
+
+
+def _read_task_sets(path):
+    """
+    Read task sets from a CSV file with the task editor columns and an
+    optional "Task Set" column that groups rows into sets.
+    """
+    frame = pd.read_csv(path)
+    if "Task Set" not in frame.columns:
+        return [frame.to_dict("records")]
+    return [group.to_dict("records") for _, group in frame.groupby("Task Set", sort=True)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a scheduling parameter sweep.")
+    parser.add_argument("tasks", help="CSV file with Name, Execution Time, Period, "
+                                      "Deadline and optionally Task Set columns")
+    parser.add_argument("--modes", nargs="+", default=["RMS", "EDF", "Adaptive"])
+    parser.add_argument("--thresholds", nargs="+", type=float, default=[0.7])
+    parser.add_argument("--sim-times", nargs="+", type=int, default=[50])
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=None)
+    parser.add_argument("--store", default=None,
+                        help="SQLite result store to reuse and save results")
+    parser.add_argument("--out", default=None, help="write results to this CSV file")
+    args = parser.parse_args(argv)
+
+    results = run_sweep(
+        _read_task_sets(args.tasks), args.modes, args.thresholds, args.sim_times,
+        args.workers, args.chunk_size, args.store
+    )
+    if args.out:
+        results.to_csv(args.out, index=False)
+    else:
+        print(results.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
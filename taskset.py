@@ -0,0 +1,137 @@
+"""
+Columnar task set representation.
+
+A TaskSet stores every task parameter and runtime counter in its own NumPy
+array instead of one dict per task.
+"""
+
+import numpy as np
+import pandas as pd
+
+COLUMNS = ["Name", "Execution Time", "Period", "Deadline"]
+
+
+class TaskSet:
+    """
+    Task set stored as parallel arrays.
+
+    Attributes:
+        names: list of task names
+        C, T, D: execution time, period and relative deadline arrays
+        remaining: remaining execution time of the current job
+        abs_deadline: absolute deadline of the current job
+        next_release: release time of the next job
+        misses: missed deadlines count
+
+    Tasks are identified by name, as in simulate_scheduler: if a name appears
+    more than once, the last row wins but keeps the position of the first.
+    """
+
+    __slots__ = ("names", "C", "T", "D",
+                 "remaining", "abs_deadline", "next_release", "misses")
+
+    def __init__(self, names, C, T, D):
+        names = [str(n) for n in names]
+        C = np.asarray(C, dtype=np.int64)
+        T = np.asarray(T, dtype=np.int64)
+        D = np.asarray(D, dtype=np.int64)
+        if not len(names) == len(C) == len(T) == len(D):
+            raise ValueError("Task columns must have the same length.")
+
+        first, last = {}, {}
+        for i, name in enumerate(names):
+            first.setdefault(name, i)
+            last[name] = i
+        if len(last) != len(names):
+            rows = [last[name] for name in first]
+            names = list(first)
+            C, T, D = C[rows], T[rows], D[rows]
+
+        self.names = names
+        self.C = C
+        self.T = T
+        self.D = D
+        self.reset()
+
+    def reset(self):
+        """
+        Clear the runtime counters before a new simulation.
+        """
+        n = len(self.names)
+        self.remaining = np.zeros(n, dtype=np.int64)
+        self.abs_deadline = np.zeros(n, dtype=np.int64)
+        self.next_release = np.zeros(n, dtype=np.int64)
+        self.misses = np.zeros(n, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.names)
+
+    def utilization(self):
+        """
+        Total utilization sum(C_i / T_i) over tasks with a positive period.
+        """
+        valid = self.T > 0
+        total = 0.0
+        # Summed in task order so the result matches compute_utilization exactly
+        for u in (self.C[valid] / self.T[valid]).tolist():
+            total += u
+        return total
+
+    @classmethod
+    def from_records(cls, tasks):
+        """
+        Build a TaskSet from a list of dicts with keys:
+            Name, Execution Time, Period, Deadline
+        """
+        return cls(
+            [t["Name"] for t in tasks],
+            [int(t["Execution Time"]) for t in tasks],
+            [int(t["Period"]) for t in tasks],
+            [int(t["Deadline"]) for t in tasks],
+        )
+
+    def to_records(self):
+        """
+        Convert back to the list-of-dicts task format.
+        """
+        return [
+            {"Name": name, "Execution Time": C, "Period": T, "Deadline": D}
+            for name, C, T, D in zip(
+                self.names, self.C.tolist(), self.T.tolist(), self.D.tolist()
+            )
+        ]
+
+    @classmethod
+    def from_frame(cls, frame):
+        """
+        Build a TaskSet from a DataFrame with the columns of the task editor.
+        """
+        return cls(
+            frame["Name"].tolist(),
+            frame["Execution Time"].astype("int64").to_numpy(),
+            frame["Period"].astype("int64").to_numpy(),
+            frame["Deadline"].astype("int64").to_numpy(),
+        )
+
+    def to_frame(self):
+        """
+        Convert to a DataFrame with the columns of the task editor.
+        """
+        return pd.DataFrame(
+            {
+                "Name": self.names,
+                "Execution Time": self.C,
+                "Period": self.T,
+                "Deadline": self.D,
+            },
+            columns=COLUMNS,
+        )
+
+
+def as_task_set(tasks):
+    """
+    Return tasks as a TaskSet, converting a list of task dicts if needed.
+    """
+    if isinstance(tasks, TaskSet):
+        return tasks
+    return TaskSet.from_records(tasks)
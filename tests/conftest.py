@@ -0,0 +1,171 @@
+import os
+import sys
+from collections import deque
+
+import pytest
+
+# The modules live at the repository root, next to app.py
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def make_random_tasks(rnd, min_tasks=1, max_tasks=5, max_C=6, max_T=20, max_D=20):
+    """
+    Random task set of min_tasks..max_tasks tasks T0, T1, ... with
+    execution times 0..max_C, periods 1..max_T and deadlines 1..max_D.
+    """
+    return [
+        {
+            "Name": f"T{k}",
+            "Execution Time": rnd.randint(0, max_C),
+            "Period": rnd.randint(1, max_T),
+            "Deadline": rnd.randint(1, max_D),
+        }
+        for k in range(rnd.randint(min_tasks, max_tasks))
+    ]
+
+
+def simulate_ticks(tasks, mode, sim_time, preemption="full", npr=0, quantum=1,
+                   util_threshold=0.7, miss_window=None, miss_high=3, miss_low=0):
+    """
+    Reference simulation, one time unit at a time.
+
+    mode is RMS, EDF, Adaptive, DM, FIFO, LLF or RR (with quantum).
+    preemption is "full", "non-preemptive" or "limited" (a region of npr
+    units opened by the first waiting job that outranks the running one).
+    Adaptive mode switches to EDF at miss_high misses, and with miss_window
+    back to RMS at miss_low misses within the window.
+
+    Returns a dict with Ticks (task name per time unit), Misses and
+    Preemptions (per task), Utilization (%) and Switches ((time, algorithm)
+    of the starting algorithm and every switch).
+    """
+    n = len(tasks)
+    names = [t["Name"] for t in tasks]
+    C = [t["Execution Time"] for t in tasks]
+    T = [t["Period"] for t in tasks]
+    D = [t["Deadline"] for t in tasks]
+    remaining = [0] * n
+    abs_deadline = [0] * n
+    release = [0] * n
+    next_release = [0] * n
+    misses = [0] * n
+    preempted = [0] * n
+    running = None
+    region_end = None
+    queue = deque()  # round robin order
+    used = 0
+
+    algo = mode
+    if mode == "Adaptive":
+        U = sum(c / t for c, t in zip(C, T))
+        algo = "RMS" if U <= util_threshold else "EDF"
+    can_return = miss_window is not None and algo == "RMS"
+    switches = [(0, algo)]
+    miss_times = []
+    ticks = []
+
+    def key(i, time):
+        if algo == "RMS":
+            return (T[i], i)
+        if algo == "EDF":
+            return (abs_deadline[i], i)
+        if algo == "DM":
+            return (D[i], i)
+        if algo == "FIFO":
+            return (release[i], i)
+        return (abs_deadline[i] - time - remaining[i], i)  # LLF
+
+    for time in range(sim_time):
+        for i in range(n):
+            if time >= next_release[i]:
+                if remaining[i] > 0:
+                    if time > abs_deadline[i]:
+                        misses[i] += 1
+                        miss_times.append(time)
+                    if queue and queue[0] == i:
+                        used = 0
+                    if i in queue:
+                        queue.remove(i)
+                remaining[i] = C[i]
+                abs_deadline[i] = time + D[i]
+                release[i] = time
+                next_release[i] += T[i]
+                if C[i] > 0:
+                    queue.append(i)
+                if running == i:
+                    running = None
+                    region_end = None
+
+        if mode == "Adaptive":
+            if miss_window is None:
+                recent = len(miss_times)
+            else:
+                recent = sum(1 for t in miss_times if t > time - miss_window)
+            if algo == "RMS" and recent >= miss_high:
+                algo = "EDF"
+                switches.append((time, algo))
+            elif can_return and algo == "EDF" and recent <= miss_low:
+                algo = "RMS"
+                switches.append((time, algo))
+
+        ready = [i for i in range(n) if remaining[i] > 0]
+        if not ready:
+            ticks.append("IDLE")
+            continue
+
+        if mode == "RR":
+            if used >= quantum:
+                queue.rotate(-1)
+                used = 0
+            top = queue[0]
+        else:
+            top = min(ready, key=lambda i: key(i, time))
+        chosen = top
+        if running is None or top == running:
+            region_end = None
+        elif preemption == "non-preemptive":
+            chosen = running
+        elif preemption == "limited":
+            if region_end is None:
+                region_end = time + npr
+            if time < region_end:
+                chosen = running
+        if running is not None and chosen != running:
+            preempted[running] += 1
+            region_end = None
+        running = chosen
+
+        ticks.append(names[chosen])
+        remaining[chosen] -= 1
+        used += 1
+        if remaining[chosen] == 0:
+            running = None
+            region_end = None
+            if mode == "RR":
+                queue.popleft()
+                used = 0
+
+    return {
+        "Ticks": ticks,
+        "Misses": dict(zip(names, misses)),
+        "Preemptions": dict(zip(names, preempted)),
+        "Utilization": 100.0 * (1 - ticks.count("IDLE") / sim_time),
+        "Switches": switches,
+    }
+
+
+@pytest.fixture
+def random_tasks():
+    return make_random_tasks
+
+
+@pytest.fixture
+def tick_reference():
+    return simulate_ticks
+
+
+@pytest.fixture
+def ticks_of():
+    def ticks(schedule):
+        return [task for _, task in schedule]
+    return ticks
@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+from admission import AdmissionController
+from analysis import qpa_test, response_times, rta_test
+
+
+def random_task(rnd, name):
+    period = rnd.randint(1, 30)
+    return {"Name": name, "Execution Time": rnd.randint(1, 8), "Period": period,
+            "Deadline": rnd.randint(1, period + 5)}
+
+
+@pytest.mark.parametrize("policy", ["RMS", "DM", "EDF"])
+def test_incremental_analysis_matches_from_scratch(policy):
+    rnd = random.Random(8)
+    for _ in range(50):
+        controller = AdmissionController(policy)
+        tasks = []  # in admission order, which breaks priority ties
+        for step in range(40):
+            candidate = random_task(rnd, f"T{rnd.randint(0, 9)}")
+            # A task with an existing name is a modification
+            trial = [candidate if t["Name"] == candidate["Name"] else t for t in tasks]
+            if candidate["Name"] not in controller:
+                trial.append(candidate)
+            expected = qpa_test(trial) if policy == "EDF" else rta_test(trial, policy)
+            assert controller.can_admit(candidate) == expected
+
+            action = rnd.choice(["add", "remove", "admit"])
+            if action == "remove" and tasks:
+                victim = rnd.choice(tasks)
+                controller.remove(victim["Name"])
+                tasks.remove(victim)
+            elif action == "add":
+                controller.add(candidate)
+                tasks = trial
+            elif controller.admit(candidate):
+                tasks = trial
+
+            assert len(controller) == len(tasks)
+            assert controller.utilization == pytest.approx(
+                sum(t["Execution Time"] / t["Period"] for t in tasks))
+            if policy == "EDF":
+                assert controller.is_schedulable() == qpa_test(tasks)
+            else:
+                assert controller.is_schedulable() == rta_test(tasks, policy)
+                assert controller.response_times() == response_times(tasks, policy)
@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from analysis import is_schedulable, qpa_test, rta_test
+from scheduler import hyperperiod, simulate_scheduler
+
+
+@pytest.mark.parametrize("algo", ["RMS", "DM", "EDF", "Adaptive"])
+def test_schedulable_sets_never_miss_in_simulation(algo, random_tasks):
+    rnd = random.Random(6)
+    proven = 0
+    for _ in range(300):
+        tasks = random_tasks(rnd, max_C=4, max_T=10, max_D=12)
+        if not is_schedulable(tasks, algo):
+            continue
+        proven += 1
+        # The schedule repeats after the first hyperperiod, and a miss shows
+        # up by the next release of the task
+        sim_time = 2 * hyperperiod(tasks) + 10
+        misses = simulate_scheduler(tasks, algo, sim_time)[1]
+        assert sum(misses.values()) == 0
+    assert proven > 50
+
+
+def deadlines_met(schedule, tasks, H):
+    """
+    Whether every job released in [0, H) ran for its execution time before
+    its deadline in the simulated schedule.
+    """
+    return all(
+        schedule.count(t["Name"], release, release + t["Deadline"]) >= t["Execution Time"]
+        for t in tasks
+        for release in range(0, H, t["Period"])
+    )
+
+
+@pytest.mark.parametrize("algo", ["RMS", "DM", "EDF"])
+def test_constrained_deadline_verdicts_are_exact(algo, random_tasks):
+    # The simulator only counts a miss when the job is still unfinished at
+    # its next release, so completion by the deadline is read off the schedule
+    rnd = random.Random(7)
+    verdicts = set()
+    for _ in range(300):
+        tasks = random_tasks(rnd, max_C=5, max_T=10)
+        for task in tasks:
+            task["Deadline"] = rnd.randint(1, task["Period"])
+        verdict = qpa_test(tasks) if algo == "EDF" else rta_test(tasks, algo)
+        H = hyperperiod(tasks)
+        schedule = simulate_scheduler(tasks, algo, H + 10)[0]
+        assert verdict == deadlines_met(schedule, tasks, H)
+        verdicts.add(verdict)
+    assert verdicts == {True, False}
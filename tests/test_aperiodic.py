@@ -0,0 +1,107 @@
+import random
+from itertools import accumulate
+
+import pytest
+
+from aperiodic import SERVER, SERVERS, simulate_aperiodic
+from scheduler import simulate_scheduler
+
+
+def random_jobs(rnd, sim_time):
+    return [{"Arrival": rnd.randint(0, sim_time), "Execution Time": rnd.randint(1, 6)}
+            for _ in range(rnd.randint(1, 10))]
+
+
+def modes_of(server):
+    return ["EDF"] if server == "tbs" else ["RMS", "EDF", "Adaptive"]
+
+
+@pytest.mark.parametrize("server", SERVERS)
+def test_no_aperiodic_load_matches_simulate_scheduler(server, random_tasks):
+    rnd = random.Random(9)
+    for _ in range(200):
+        tasks = random_tasks(rnd, min_tasks=0, max_tasks=6, max_C=8, max_D=25)
+        mode = rnd.choice(modes_of(server))
+        sim_time = rnd.randint(1, 300)
+        threshold = rnd.random()
+        period = rnd.randint(1, 20)
+        budget = rnd.randint(1, period)
+        schedule, misses, responses, util, U, used_algo = simulate_aperiodic(
+            tasks, [], server, budget, period, mode=mode, sim_time=sim_time,
+            util_threshold=threshold)
+        # The server bandwidth counts towards the adaptive threshold
+        expected = simulate_scheduler(tasks, mode, sim_time, threshold - budget / period)
+        assert schedule.segments == expected[0].segments
+        assert (misses, util, used_algo) == (expected[1], expected[2], expected[4])
+        assert U == pytest.approx(expected[3] + budget / period)
+        assert responses == []
+
+
+@pytest.mark.parametrize("server, response", [
+    ("polling", 10),  # the budget is dropped at 0 and comes back at 5 and 10
+    ("deferrable", 5),  # the budget kept since 0 serves 2 units at once
+    ("sporadic", 6),  # the 2 units used at 1 come back at 6
+    ("tbs", 3),  # deadline 1 + 3 / 0.4, nothing else to run
+])
+def test_single_job_response_time(server, response):
+    jobs = [{"Name": "J", "Arrival": 1, "Execution Time": 3}]
+    _, _, responses, *_ = simulate_aperiodic([], jobs, server, 2, 5, mode="EDF", sim_time=20)
+    assert responses == [{"Job": "J", "Arrival": 1, "Execution Time": 3,
+                          "Finish": 1 + response, "Response Time": response}]
+
+
+@pytest.mark.parametrize("server", ["polling", "deferrable", "sporadic"])
+def test_server_stays_within_its_budget(server, random_tasks):
+    rnd = random.Random(10)
+    for _ in range(200):
+        tasks = random_tasks(rnd, max_tasks=4, max_C=4, max_T=30, max_D=30)
+        sim_time = rnd.randint(1, 200)
+        jobs = random_jobs(rnd, sim_time)
+        period = rnd.randint(1, 20)
+        budget = rnd.randint(1, period)
+        schedule, _, responses, *_ = simulate_aperiodic(
+            tasks, jobs, server, budget, period, mode=rnd.choice(["RMS", "EDF"]),
+            sim_time=sim_time)
+        if server == "sporadic":
+            # Budget comes back one period after the server became active, so
+            # any window of length L holds at most ceil((L + T_s - Q) / T_s) * Q
+            server_time = [0] + list(accumulate(task == SERVER for _, task in schedule))
+            for start in range(sim_time):
+                for stop in range(start + 1, sim_time + 1):
+                    bound = budget * -(-(stop - start + period - budget) // period)
+                    assert server_time[stop] - server_time[start] <= bound
+        else:
+            for start in range(0, sim_time, period):
+                assert schedule.count(SERVER, start, start + period) <= budget
+        # Jobs are served in arrival order, and the server only does their work
+        served = sum(r["Execution Time"] for r in responses if r["Finish"] is not None)
+        assert served <= schedule.count(SERVER, 0, sim_time)
+        assert schedule.count(SERVER, 0, sim_time) <= sum(j["Execution Time"] for j in jobs)
+        finished = sorted((r["Arrival"], r["Finish"]) for r in responses if r["Finish"] is not None)
+        assert all(r >= r0 for (_, r0), (_, r) in zip(finished, finished[1:]))
+        for r in responses:
+            if r["Finish"] is not None:
+                assert r["Response Time"] >= r["Execution Time"]
+
+
+def test_tbs_jobs_meet_their_deadlines(random_tasks):
+    rnd = random.Random(11)
+    for _ in range(200):
+        tasks = random_tasks(rnd, max_tasks=4, max_C=4, max_T=30)
+        for task in tasks:
+            task["Deadline"] = task["Period"]
+        Ut = sum(t["Execution Time"] / t["Period"] for t in tasks)
+        if Ut >= 1:
+            continue
+        Us = rnd.uniform(0.05, 1 - Ut)
+        sim_time = rnd.randint(1, 200)
+        jobs = random_jobs(rnd, sim_time)
+        _, misses, responses, *_ = simulate_aperiodic(
+            tasks, jobs, "tbs", server_utilization=Us, mode="EDF", sim_time=sim_time)
+        assert sum(misses.values()) == 0
+        # With U_p + U_s <= 1 under EDF every job finishes by its TBS deadline
+        deadline = 0
+        for r in sorted(responses, key=lambda r: r["Arrival"]):
+            deadline = max(r["Arrival"], deadline) + r["Execution Time"] / Us
+            if deadline <= sim_time:
+                assert r["Finish"] is not None and r["Finish"] <= deadline
@@ -0,0 +1,37 @@
+import random
+
+import pytest
+
+import compiled
+from scheduler import simulate_scheduler
+
+
+@pytest.mark.parametrize("mode", ["RMS", "EDF", "Adaptive"])
+def test_compiled_engine_matches_tick_engine(mode, random_tasks):
+    # Without Numba this checks the fallback to the tick engine
+    rnd = random.Random(5)
+    for _ in range(500):
+        tasks = random_tasks(rnd, min_tasks=0, max_tasks=6, max_T=15, max_D=15)
+        sim_time = rnd.randint(1, 300)
+        threshold = rnd.choice([0.3, 0.7, 0.95])
+        tick = simulate_scheduler(tasks, mode, sim_time, threshold, engine="tick")
+        fast = simulate_scheduler(tasks, mode, sim_time, threshold, engine="compiled")
+        assert fast[0].segments == tick[0].segments
+        assert fast[0].switches == tick[0].switches
+        assert fast[1:] == tick[1:]
+
+
+@pytest.mark.skipif(not compiled.AVAILABLE, reason="Numba is not installed")
+def test_compiled_loop_matches_python_loop():
+    import numpy as np
+
+    rnd = random.Random(6)
+    for _ in range(200):
+        n = rnd.randint(1, 6)
+        C = np.array([rnd.randint(0, 6) for _ in range(n)], np.int64)
+        T = np.array([rnd.randint(1, 15) for _ in range(n)], np.int64)
+        D = np.array([rnd.randint(1, 15) for _ in range(n)], np.int64)
+        args = (C, T, D, rnd.choice([compiled.RMS, compiled.EDF, compiled.ADAPTIVE]),
+                rnd.random() < 0.5, rnd.randint(1, 300))
+        for a, b in zip(compiled.tick_loop(*args), compiled._tick_loop(*args)):
+            assert np.array_equal(a, b)
@@ -0,0 +1,41 @@
+import random
+
+import pytest
+
+from multiprocessor import HEURISTICS, partition_tasks, simulate_multiprocessor
+from policies import RR
+from scheduler import simulate_scheduler
+
+
+@pytest.mark.parametrize("mode", ["RMS", "DM", "EDF", "FIFO"])
+def test_global_priority_policy_on_one_core_matches_single_core(mode, random_tasks):
+    rnd = random.Random(4)
+    for _ in range(200):
+        tasks = random_tasks(rnd, max_tasks=6, max_C=7, max_T=16, max_D=16)
+        sim_time = rnd.randint(1, 200)
+        schedules, misses, _, _, _, algos = simulate_multiprocessor(tasks, 1, "global", mode, sim_time)
+        single = simulate_scheduler(tasks, mode, sim_time)
+        assert schedules[0].segments == single[0].segments
+        assert (misses, algos) == (single[1], [single[4]])
+
+
+def test_global_rejects_dynamic_policies():
+    tasks = [{"Name": "A", "Execution Time": 1, "Period": 4, "Deadline": 4}]
+    for mode in ("LLF", RR(2)):
+        with pytest.raises(ValueError):
+            simulate_multiprocessor(tasks, 2, "global", mode, 10)
+
+
+@pytest.mark.parametrize("heuristic", HEURISTICS)
+def test_partitioning_places_tasks_without_execution_time(heuristic):
+    tasks = [
+        {"Name": "A", "Execution Time": 3, "Period": 4, "Deadline": 4},
+        {"Name": "Idle", "Execution Time": 0, "Period": 5, "Deadline": 5},
+        {"Name": "B", "Execution Time": 2, "Period": 4, "Deadline": 4},
+    ]
+    cores, unassigned = partition_tasks(tasks, 2, heuristic)
+    busy = [[t["Name"] for t in core if t["Execution Time"] > 0] for core in cores]
+    assert sorted(busy) == [["A"], ["B"]]
+    assert sum(len(core) for core in cores) == 3 and unassigned == []
+    misses = simulate_multiprocessor(tasks, 2, "partitioned", "EDF", 20, heuristic=heuristic)[1]
+    assert misses == {"A": 0, "Idle": 0, "B": 0}
@@ -0,0 +1,81 @@
+import random
+
+import pytest
+
+from aperiodic import simulate_aperiodic
+from policies import EDF, POLICIES, RR, simulate_policy
+from preemption import simulate_preemptive
+from scheduler import iter_schedule, simulate_scheduler
+
+
+@pytest.mark.parametrize("mode", ["RMS", "EDF"])
+def test_plugin_matches_builtin_engine(mode, random_tasks):
+    rnd = random.Random(1)
+    for _ in range(300):
+        tasks = random_tasks(rnd, max_tasks=6, max_C=7, max_T=16, max_D=16)
+        sim_time = rnd.randint(1, 300)
+        builtin = simulate_scheduler(tasks, mode, sim_time)
+        plugin = simulate_policy(tasks, mode, sim_time)
+        assert plugin[0].segments == builtin[0].segments
+        assert plugin[1:] == builtin[1:]
+
+
+@pytest.mark.parametrize("mode", ["DM", "FIFO", "LLF"])
+def test_policy_matches_tick_reference(mode, random_tasks, tick_reference, ticks_of):
+    rnd = random.Random(2)
+    for _ in range(300):
+        tasks = random_tasks(rnd, max_tasks=6, max_C=7, max_T=16, max_D=16)
+        sim_time = rnd.randint(1, 300)
+        schedule, misses, util, _, used_algo = simulate_scheduler(tasks, mode, sim_time)
+        ref = tick_reference(tasks, mode, sim_time)
+        assert (ticks_of(schedule), misses, used_algo) == (ref["Ticks"], ref["Misses"], mode)
+        assert util == pytest.approx(ref["Utilization"])
+
+
+@pytest.mark.parametrize("quantum", [1, 2, 4])
+def test_round_robin_matches_tick_reference(quantum, random_tasks, tick_reference, ticks_of):
+    rnd = random.Random(3)
+    for _ in range(300):
+        tasks = random_tasks(rnd, max_tasks=6, max_C=7, max_T=16, max_D=16)
+        sim_time = rnd.randint(1, 300)
+        schedule, misses, util, _, _ = simulate_scheduler(tasks, RR(quantum), sim_time)
+        ref = tick_reference(tasks, "RR", sim_time, quantum=quantum)
+        assert (ticks_of(schedule), misses) == (ref["Ticks"], ref["Misses"])
+        assert util == pytest.approx(ref["Utilization"])
+
+
+def test_used_algo_is_the_registered_name(monkeypatch):
+    monkeypatch.setitem(POLICIES, "Deadline", EDF)
+    tasks = [{"Name": "A", "Execution Time": 1, "Period": 4, "Deadline": 4}]
+    assert simulate_scheduler(tasks, "Deadline", 10)[4] == "Deadline"
+    assert simulate_scheduler(tasks, EDF(), 10)[4] == "EDF"
+
+
+@pytest.mark.parametrize("option", [
+    {"engine": "tick"},
+    {"steady_state": True},
+    {"miss_window": 10},
+    {"miss_high": 2},
+    {"miss_low": 1},
+    {"util_threshold": 0.5},
+])
+def test_policies_reject_adaptive_options(option):
+    tasks = [{"Name": "A", "Execution Time": 1, "Period": 4, "Deadline": 4}]
+    with pytest.raises(ValueError):
+        simulate_scheduler(tasks, "LLF", 10, **option)
+
+
+@pytest.mark.parametrize("simulate", [
+    lambda tasks, mode: list(iter_schedule(tasks, mode, 12)),
+    lambda tasks, mode: simulate_preemptive(tasks, mode, "full", 12),
+    lambda tasks, mode: simulate_aperiodic(tasks, [], mode=mode, sim_time=12),
+])
+@pytest.mark.parametrize("mode", ["DM", "LLF", RR(2)])
+def test_builtin_only_simulations_reject_policies(simulate, mode):
+    # These used to schedule DM by EDF while reporting "DM"
+    tasks = [
+        {"Name": "X", "Execution Time": 8, "Period": 20, "Deadline": 10},
+        {"Name": "Y", "Execution Time": 1, "Period": 8, "Deadline": 8},
+    ]
+    with pytest.raises(ValueError):
+        simulate(tasks, mode)
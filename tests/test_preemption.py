@@ -0,0 +1,117 @@
+import random
+import signal
+
+import pytest
+
+from preemption import simulate_preemptive
+from scheduler import simulate_scheduler
+
+
+@pytest.mark.parametrize("mode", ["RMS", "EDF", "Adaptive"])
+def test_full_matches_simulate_scheduler(mode, random_tasks):
+    rnd = random.Random(1)
+    for _ in range(300):
+        tasks = random_tasks(rnd)
+        sim_time = rnd.randint(1, 200)
+        schedule, misses, _, util, _, algo, _ = simulate_preemptive(tasks, mode, "full", sim_time)
+        ref = simulate_scheduler(tasks, mode, sim_time, engine="tick")
+        assert schedule.segments == ref[0].segments
+        assert (misses, util, algo) == (ref[1], ref[2], ref[4])
+
+
+@pytest.mark.parametrize("mode", ["RMS", "EDF"])
+@pytest.mark.parametrize("preemption, npr", [
+    ("full", 0),
+    ("non-preemptive", 0),
+    ("limited", 0),
+    ("limited", 1),
+    ("limited", 3),
+])
+def test_matches_tick_reference(mode, preemption, npr, random_tasks, tick_reference, ticks_of):
+    rnd = random.Random(2)
+    for _ in range(300):
+        tasks = random_tasks(rnd)
+        sim_time = rnd.randint(1, 200)
+        schedule, misses, preemptions, *_ = simulate_preemptive(
+            tasks, mode, preemption, sim_time, npr=npr
+        )
+        ref = tick_reference(tasks, mode, sim_time, preemption, npr)
+        assert (ticks_of(schedule), misses, preemptions) == (
+            ref["Ticks"], ref["Misses"], ref["Preemptions"]
+        )
+
+
+def test_blocking_thresholds_and_unbounded_regions_are_non_preemptive(random_tasks):
+    rnd = random.Random(3)
+    for _ in range(300):
+        tasks = random_tasks(rnd)
+        mode = rnd.choice(["RMS", "EDF"])
+        sim_time = rnd.randint(1, 200)
+        expected = simulate_preemptive(tasks, mode, "non-preemptive", sim_time)
+        blocking = simulate_preemptive(tasks, mode, "threshold", sim_time,
+                                       thresholds={t["Name"]: -1 for t in tasks})
+        unbounded = simulate_preemptive(tasks, mode, "limited", sim_time, npr=10**9)
+        for result in (blocking, unbounded):
+            assert result[0].segments == expected[0].segments
+            assert result[1:3] == expected[1:3]
+        assert sum(expected[2].values()) == 0
+
+
+@pytest.mark.parametrize("npr", [3, 4])
+def test_limited_region_ends_when_no_job_outranks_the_running_one(npr, tick_reference, ticks_of):
+    # The job that opened T0's region stops outranking it under EDF; this
+    # used to spin on zero-length segments forever
+    tasks = [
+        {"Name": "T0", "Execution Time": 9, "Period": 10, "Deadline": 10},
+        {"Name": "T1", "Execution Time": 2, "Period": 3, "Deadline": 2},
+    ]
+    signal.signal(signal.SIGALRM, lambda *_: pytest.fail("simulation did not terminate"))
+    signal.alarm(5)
+    try:
+        schedule, misses, preemptions, *_ = simulate_preemptive(tasks, "EDF", "limited", 21, npr=npr)
+    finally:
+        signal.alarm(0)
+    assert len(schedule) == 21
+    ref = tick_reference(tasks, "EDF", 21, "limited", npr)
+    assert (ticks_of(schedule), misses, preemptions) == (
+        ref["Ticks"], ref["Misses"], ref["Preemptions"]
+    )
+
+
+def test_limited_with_switching_cost_terminates(random_tasks):
+    rnd = random.Random(4)
+    for _ in range(300):
+        tasks = random_tasks(rnd)
+        sim_time = rnd.randint(1, 200)
+        schedule = simulate_preemptive(tasks, rnd.choice(["RMS", "EDF", "Adaptive"]), "limited",
+                                       sim_time, npr=rnd.randint(0, 4),
+                                       switch_cost=rnd.randint(0, 2), crpd=rnd.randint(0, 2))[0]
+        assert len(schedule) == sim_time
+
+
+def test_job_displaced_during_its_overhead_is_not_preempted():
+    # B is released while A's switch overhead runs, so A never executes and
+    # must not be counted as preempted or charged its CRPD
+    tasks = [
+        {"Name": "A", "Execution Time": 2, "Period": 100, "Deadline": 100},
+        {"Name": "B", "Execution Time": 1, "Period": 3, "Deadline": 3},
+    ]
+    *_, preemptions, _, _, _, overhead = simulate_preemptive(
+        tasks, "RMS", "full", 14, switch_cost=2, crpd={"A": 5})
+    assert preemptions == {"A": 0, "B": 0}
+    assert overhead == {"Switches": 5, "Preemptions": 0, "Overhead Time": 10}
+
+
+def test_crpd_is_charged_when_a_preempted_job_resumes():
+    tasks = [
+        {"Name": "A", "Execution Time": 4, "Period": 100, "Deadline": 100},
+        {"Name": "B", "Execution Time": 1, "Period": 5, "Deadline": 5},
+    ]
+    schedule, _, preemptions, *_ = simulate_preemptive(
+        tasks, "RMS", "full", 12, switch_cost=1, crpd={"A": 1})
+    assert schedule.segments == [
+        ("OVERHEAD", 0, 1), ("B", 1, 2), ("OVERHEAD", 2, 3), ("A", 3, 5),
+        ("OVERHEAD", 5, 6), ("B", 6, 7), ("OVERHEAD", 7, 9), ("A", 9, 10),
+        ("OVERHEAD", 10, 11), ("B", 11, 12),
+    ]
+    assert preemptions == {"A": 2, "B": 0}
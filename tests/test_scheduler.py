@@ -0,0 +1,86 @@
+import random
+
+import pytest
+
+from scheduler import simulate_scheduler
+from taskset import TaskSet
+
+
+@pytest.mark.parametrize("mode", ["RMS", "EDF", "Adaptive"])
+def test_event_engine_matches_tick_engine(mode, random_tasks):
+    rnd = random.Random(1)
+    for _ in range(500):
+        tasks = random_tasks(rnd, min_tasks=0, max_tasks=7, max_C=8, max_D=25)
+        sim_time = rnd.randint(1, 300)
+        threshold = rnd.random()
+        event = simulate_scheduler(tasks, mode, sim_time, threshold)
+        tick = simulate_scheduler(tasks, mode, sim_time, threshold, engine="tick")
+        assert event[0].segments == tick[0].segments
+        assert event[0].switches == tick[0].switches
+        assert event[1:] == tick[1:]
+
+
+def test_task_set_input_matches_dicts(random_tasks):
+    rnd = random.Random(2)
+    for _ in range(200):
+        tasks = random_tasks(rnd, min_tasks=0, max_tasks=7, max_C=8, max_D=25)
+        mode = rnd.choice(["RMS", "EDF", "Adaptive"])
+        sim_time = rnd.randint(1, 300)
+        a = simulate_scheduler(tasks, mode, sim_time)
+        b = simulate_scheduler(TaskSet.from_records(tasks), mode, sim_time)
+        assert a[0].segments == b[0].segments
+        assert a[1:] == b[1:]
+
+
+@pytest.mark.parametrize("mode", ["RMS", "EDF", "Adaptive"])
+@pytest.mark.parametrize("windowed", [False, True])
+def test_steady_state_matches_full_horizon(mode, windowed, random_tasks):
+    rnd = random.Random(3)
+    extrapolated = 0
+    for _ in range(300):
+        # Short periods keep the hyperperiod well inside the horizon
+        tasks = random_tasks(rnd, max_tasks=4, max_C=5, max_T=8, max_D=10)
+        sim_time = rnd.randint(1, 1000)
+        threshold = rnd.random()
+        switching = {}
+        if windowed:
+            miss_high = rnd.randint(1, 4)
+            switching = {"miss_window": rnd.randint(1, 20), "miss_high": miss_high,
+                         "miss_low": rnd.randint(0, miss_high - 1)}
+        full = simulate_scheduler(tasks, mode, sim_time, threshold, **switching)
+        steady = simulate_scheduler(tasks, mode, sim_time, threshold, steady_state=True,
+                                    **switching)
+        assert steady[1:] == full[1:]
+        # The simulated part of the horizon is the start of the full schedule
+        ticks = list(steady[0])
+        assert ticks == list(full[0])[:len(ticks)]
+        extrapolated += len(ticks) < sim_time
+    assert extrapolated > 100
+
+
+def test_windowed_switching_matches_tick_reference(random_tasks, tick_reference, ticks_of):
+    rnd = random.Random(5)
+    to_edf = to_rms = wake_ups = 0
+    for _ in range(500):
+        tasks = random_tasks(rnd, max_tasks=6, max_C=6, max_D=25)
+        sim_time = rnd.randint(1, 300)
+        # Mostly start with RMS, which is the only start that can switch back
+        threshold = rnd.uniform(1, 4)
+        miss_high = rnd.randint(1, 5)
+        switching = {"miss_window": rnd.randint(1, 40), "miss_high": miss_high,
+                     "miss_low": rnd.randint(0, miss_high - 1)}
+        schedule, misses, util, _, used_algo = simulate_scheduler(
+            tasks, "Adaptive", sim_time, threshold, **switching)
+        ref = tick_reference(tasks, "Adaptive", sim_time, util_threshold=threshold, **switching)
+        assert ticks_of(schedule) == ref["Ticks"]
+        assert misses == ref["Misses"]
+        assert util == pytest.approx(ref["Utilization"])
+        assert schedule.switches == ref["Switches"]
+        assert used_algo == ref["Switches"][-1][1]
+        algos = [algo for _, algo in schedule.switches]
+        to_edf += ("RMS", "EDF") in zip(algos, algos[1:])
+        to_rms += ("EDF", "RMS") in zip(algos, algos[1:])
+        # Switches back between releases, when the oldest miss leaves the window
+        wake_ups += any(algo == "RMS" and t > 0 and all(t % task["Period"] for task in tasks)
+                        for t, algo in schedule.switches)
+    assert to_edf > 20 and to_rms > 20 and wake_ups > 5
@@ -0,0 +1,41 @@
+import pytest
+
+from policies import EDF, RR
+from scheduler import simulate_scheduler
+from store import ResultStore, cached_simulate, result_key
+
+TASKS = [
+    {"Name": "A", "Execution Time": 2, "Period": 5, "Deadline": 5},
+    {"Name": "B", "Execution Time": 3, "Period": 7, "Deadline": 7},
+]
+
+
+def test_cached_result_matches_simulation(tmp_path):
+    store = ResultStore(str(tmp_path / "results.sqlite3"))
+    first = cached_simulate(store, TASKS, "Adaptive", 40)
+    again = cached_simulate(store, TASKS, "Adaptive", 40)
+    fresh = simulate_scheduler(TASKS, "Adaptive", 40)
+    assert len(store) == 1
+    for result in (first, again):
+        assert result[0].segments == fresh[0].segments
+        assert result[0].switches == fresh[0].switches
+        assert result[1:] == fresh[1:]
+
+
+def test_policy_instances_are_keyed_by_parameters(tmp_path):
+    store = ResultStore(str(tmp_path / "results.sqlite3"))
+    first = cached_simulate(store, TASKS, RR(1), 40)
+    again = cached_simulate(store, TASKS, RR(1), 40)
+    other = cached_simulate(store, TASKS, RR(3), 40)
+    assert len(store) == 2
+    assert again[0].segments == first[0].segments
+    assert other[0].segments == simulate_scheduler(TASKS, RR(3), 40)[0].segments
+
+
+def test_unserializable_policy_parameters_are_rejected():
+    class Tagged(EDF):
+        def __init__(self):
+            self.tag = object()
+
+    with pytest.raises(ValueError):
+        result_key(TASKS, Tagged(), 40, 0.7)
@@ -0,0 +1,14 @@
+import random
+
+from policies import RR
+from sweep import run_sweep
+
+
+def test_pooled_sweep_matches_single_process(random_tasks):
+    rnd = random.Random(12)
+    task_sets = [random_tasks(rnd, max_tasks=4) for _ in range(4)]
+    modes = ["RMS", "EDF", "Adaptive", "DM", RR(2)]
+    single = run_sweep(task_sets, modes, [0.5, 0.9], [30, 60], max_workers=1)
+    pooled = run_sweep(task_sets, modes, [0.5, 0.9], [30, 60], max_workers=2, chunk_size=7)
+    assert single.equals(pooled)
+    assert list(single["Mode"].unique()) == ["RMS", "EDF", "Adaptive", "DM", "RR(quantum=2)"]